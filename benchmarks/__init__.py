@@ -0,0 +1 @@
+from .run_benchmarks import EXAMPLES, load_example, run_benchmark, run_benchmarks, compare_with_reference
@@ -0,0 +1,97 @@
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import h5py
+import numpy as np
+
+
+EXAMPLES = ['spinning_top', 'beam_fourbar', 'beam_haug', 'beam_lateralbuckling', 'beam_rightangle',
+            'beam_rotatingshaft', 'beam_slidercrankTiso', 'beam_flexible_pendulum']
+EXAMPLES_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+
+
+def load_example(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(EXAMPLES_DIRECTORY, name, name + '.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def compare_with_reference(file_name, reference_file_name):
+    errors = {}
+    with h5py.File(file_name, 'r') as file_id, h5py.File(reference_file_name, 'r') as reference_id:
+        n = min(file_id['time'].shape[0], reference_id['time'].shape[0])
+        if not np.allclose(file_id['time'][:n], reference_id['time'][:n]):
+            return None
+
+        def compare_dataset(name, dataset_id):
+            if isinstance(dataset_id, h5py.Dataset) and dataset_id.ndim == 2 and name in reference_id:
+                values, reference_values = dataset_id[:, :n], reference_id[name][:, :n]
+                scale = max(np.max(np.abs(reference_values)), 1.e-12)
+                errors[name] = float(np.max(np.abs(values - reference_values)) / scale)
+        file_id.visititems(compare_dataset)
+    return max(errors.values()) if errors else None
+
+
+def run_benchmark(name, refinement=1, time_scale=1., output_directory='benchmark_results'):
+    os.makedirs(output_directory, exist_ok=True)
+    file_name = os.path.join(output_directory, name + '_refinement_' + str(refinement))
+    integrator = load_example(name).build_integrator(file_name=file_name, refinement=refinement)
+    integrator.tip.T *= time_scale
+
+    t0 = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        integrator.solve()
+    wall_time = time.perf_counter() - t0
+
+    reference_file_name = os.path.join(EXAMPLES_DIRECTORY, name, name + '.h5')
+    return {
+        'name': name,
+        'refinement': refinement,
+        'T': integrator.tip.T,
+        'number_of_dofs': int(np.sum(integrator.model.number_of_dofs)),
+        'number_of_steps': integrator.number_of_steps,
+        'wall_time': wall_time,
+        'time_per_step': wall_time / max(integrator.number_of_steps, 1),
+        'mean_number_of_iterations': integrator.mean_number_of_iterations,
+        'max_number_of_iterations': integrator.max_number_of_iterations,
+        'number_of_factorizations': integrator.linear_solver.number_of_factorizations,
+        'peak_memory_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.,
+        'relative_error': compare_with_reference(file_name + '.h5', reference_file_name)
+        if os.path.exists(reference_file_name) else None,
+    }
+
+
+def run_benchmarks(names=EXAMPLES, refinements=(1, ), time_scale=1., output_directory='benchmark_results'):
+    results = []
+    for name in names:
+        for refinement in refinements:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(run_benchmark, name, refinement, time_scale, output_directory).result()
+            print(result['name'], '; refinement: ', result['refinement'], '; dofs: ', result['number_of_dofs'],
+                  '; steps: ', result['number_of_steps'], '; wall time: ', result['wall_time'],
+                  '; time per step: ', result['time_per_step'], '; mean nit: ', result['mean_number_of_iterations'],
+                  '; peak memory [MB]: ', result['peak_memory_mb'], '; relative error: ', result['relative_error'])
+            results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the example models as benchmarks.')
+    parser.add_argument('examples', nargs='*', default=EXAMPLES)
+    parser.add_argument('--refinement', type=int, nargs='+', default=[1])
+    parser.add_argument('--time-scale', type=float, default=1.)
+    parser.add_argument('--output-directory', default='benchmark_results')
+    parser.add_argument('--json', default=None)
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.examples, args.refinement, args.time_scale, args.output_directory)
+    if args.json is not None:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2, default=float)
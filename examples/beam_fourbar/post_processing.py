@@ -1,15 +1,11 @@
-import h5py
-import numpy as np
 import matplotlib.pyplot as plt
 
+from mb_sef_py.utils import Results
 
-file_name = "beam_fourbar.h5"
-file = h5py.File(file_name)
 
-time = np.array(file["time"]).reshape(-1, 1)
-motion_3 = file["node_3/MOTION"]
+results = Results("beam_fourbar.h5")
 
-xyz = np.array(motion_3[:3, :])
+time, xyz = results.read("node_3/MOTION", rows=slice(0, 3))
 
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
 ax1.plot(time, xyz[0, :] - xyz[0, 0], 'b-')
@@ -18,35 +18,36 @@ def imposed_rotation(t):
     return omega * T * phi
 
 
-model = Model()
+def build_integrator(file_name='beam_haug', refinement=1, T=20.):
+    model = Model()
 
-frame_root = Frame()
-node_root = model.add_node(NodalFrame, frame_root, 'node_root')
-frame_tip = Frame(x=np.array([8., 0., 0.]))
-node_tip = model.add_node(NodalFrame, frame_tip, 'node_tip')
+    frame_root = Frame()
+    node_root = model.add_node(NodalFrame, frame_root, 'node_root')
+    frame_tip = Frame(x=np.array([8., 0., 0.]))
+    node_tip = model.add_node(NodalFrame, frame_tip, 'node_tip')
 
+    beam_props = BeamProperties_EIGJ(EA=5.03e6, GA_1=1.94e6, GA_2=1.94e6,
+                                     GJ=566, EI_1=566, EI_2=566,
+                                     m=0.201, m_11=2 * 22.7e-6, m_22=22.7e-6, m_33=22.7e-6)
+    discretize_beam(model, node_root, node_tip, refinement * 10, beam_props)
 
-beam_props = BeamProperties_EIGJ(EA=5.03e6, GA_1=1.94e6, GA_2=1.94e6,
-                                 GJ=566, EI_1=566, EI_2=566,
-                                 m=0.201, m_11=2 * 22.7e-6, m_22=22.7e-6, m_33=22.7e-6)
-discretize_beam(model, node_root, node_tip, 10, beam_props)
+    hj_props = HingeJointProperties(axis=np.array([0., 0., 1.]))
+    hinge = model.add_element(hj_props, node_root, element_type=GroundJointElement)
 
-hj_props = HingeJointProperties(axis=np.array([0., 0., 1.]))
-hinge = model.add_element(hj_props, node_root, element_type=GroundJointElement)
+    sc_props = ServoConstraintProperties(imposed_rotation)
+    model.add_element(sc_props, hinge)
 
-sc_props = ServoConstraintProperties(imposed_rotation)
-model.add_element(sc_props, hinge)
+    logger = Logger(file_name, periodicity=2)
+    logger.add_sensor(SensorNode(node_root, LogNodalFields.MOTION))
+    logger.add_sensor(SensorNode(node_tip, LogNodalFields.MOTION))
 
+    time_integration_parameters = TimeIntegrationParameters()
+    time_integration_parameters.rho = .0
+    time_integration_parameters.T = T
+    time_integration_parameters.h = 2.e-3
+    integrator = GeneralizedAlpha(model, time_integration_parameters, logger)
+    return integrator
 
-logger = Logger('beam_haug', periodicity=2)
-logger.add_sensor(SensorNode(node_root, LogNodalFields.MOTION))
-logger.add_sensor(SensorNode(node_tip, LogNodalFields.MOTION))
 
-
-time_integration_parameters = TimeIntegrationParameters()
-time_integration_parameters.rho = .0
-time_integration_parameters.T = 20.
-time_integration_parameters.h = 2.e-3
-integrator = GeneralizedAlpha(model, time_integration_parameters, logger)
-
-integrator.solve()
+if __name__ == '__main__':
+    build_integrator().solve()
@@ -1,30 +1,17 @@
-import h5py
 import numpy as np
 import matplotlib.pyplot as plt
-from mb_sef_py.math.SE3 import tilde
 
+from mb_sef_py.utils import Results
 
-file_name = "beam_haug.h5"
-file = h5py.File(file_name)
 
-time = np.array(file["time"]).reshape(-1, 1)
-motion_0 = file["node_root/MOTION"]
-motion_1 = file["node_tip/MOTION"]
+results = Results("beam_haug.h5")
 
-xyz_0 = np.array(motion_0[:3, :])
-xyz_1 = np.array(motion_1[:3, :])
+time, xyz_0 = results.get_positions("node_root/MOTION")
+_, xyz_1 = results.get_positions("node_tip/MOTION")
+_, R = results.get_rotation_matrices("node_root/MOTION")
 
-e = motion_0[3:, 0]
-R0 = np.eye(3) + 2*e[0]*tilde(e[1:]) + 2*np.matmul(tilde(e[1:]), tilde(e[1:]))
-
-Defo = []
-for n in range(len(time)):
-    e = motion_0[3:, n]
-    R = np.eye(3) + 2*e[0]*tilde(e[1:]) + 2*np.matmul(tilde(e[1:]), tilde(e[1:]))
-    x_rb = xyz_0[:, n] + np.matmul(np.matmul(R, np.transpose(R0)), xyz_1[:, 0] - xyz_0[:, 0])
-    defo = np.matmul(np.transpose(R), xyz_1[:, n] - x_rb)
-    Defo.append(defo)
-Defo = np.array(Defo)
+x_rb = xyz_0 + np.matmul(np.matmul(R, np.transpose(R[0])), xyz_1[0] - xyz_0[0])
+Defo = np.einsum('nji,nj->ni', R, xyz_1 - x_rb)
 
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
 ax1.plot(time, Defo[:, 0], 'ro-')
@@ -1,14 +1,13 @@
-import h5py
 import numpy as np
 import matplotlib.pyplot as plt
 
+from mb_sef_py.utils import Results
 
-file_name = "beam_lateralbuckling.h5"
-file = h5py.File(file_name)
 
-time = np.array(file["time"]).reshape(-1, 1)
-motion_1 = np.array(file["node_1/MOTION"])
-velocity_1 = np.array(file["node_1/VELOCITY"])
+results = Results("beam_lateralbuckling.h5")
+
+time, motion_1 = results.read("node_1/MOTION")
+_, velocity_1 = results.read("node_1/VELOCITY")
 
 xyz = motion_1[:3, :]
 
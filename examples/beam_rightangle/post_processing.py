@@ -1,14 +1,12 @@
-import h5py
-import numpy as np
 import matplotlib.pyplot as plt
 
+from mb_sef_py.utils import Results
 
-file_name = "beam_rightangle.h5"
-file = h5py.File(file_name)
 
-time = np.array(file["time"]).reshape(-1, 1)
-motion_1 = file["mid node/MOTION"]
-motion_2 = file["tip node/MOTION"]
+results = Results("beam_rightangle.h5")
+
+time, motion_1 = results.read("mid node/MOTION", rows=slice(0, 3))
+_, motion_2 = results.read("tip node/MOTION", rows=slice(0, 3))
 
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
 ax1.plot(time, motion_1[2, :], 'b-')
@@ -1,15 +1,12 @@
-import h5py
-import numpy as np
 import matplotlib.pyplot as plt
 
+from mb_sef_py.utils import Results
 
-file_name = "beam_rotatingshaft.h5"
-file = h5py.File(file_name)
 
-node_mid_motion = file["node_mid/MOTION"]
-node_mid_velocity = file["node_mid/VELOCITY"]
-xyz = np.array(node_mid_motion[:3, :])
-v_xyz = np.array(node_mid_velocity[:3, :])
+results = Results("beam_rotatingshaft.h5")
+
+_, xyz = results.read("node_mid/MOTION", rows=slice(0, 3))
+_, v_xyz = results.read("node_mid/VELOCITY", rows=slice(0, 3))
 
 
 fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(10, 5))
@@ -1,43 +1,23 @@
-import h5py
 import numpy as np
 import matplotlib.pyplot as plt
 
-from mb_sef_py.math.SO3 import tilde
-
-file_name = "beam_slidercrankTiso.h5"
-file = h5py.File(file_name)
-
-time = np.array(file["time"]).reshape(-1, 1)
-motion_O = file["node_0/MOTION"]
-motion_M = file["node_M/MOTION"]
-motion_B = file["node_Br/MOTION"]
-motion_N = file["node_N/MOTION"]
-
-xyz_O = np.array(motion_O[:3, :])
-xyz_M = np.array(motion_M[:3, :])
-xyz_B = np.array(motion_B[:3, :])
-xyz_N = np.array(motion_N[:3, :])
-
-e = motion_O[3:, 0]
-R0 = np.eye(3) + 2*e[0]*tilde(e[1:]) + 2*np.matmul(tilde(e[1:]), tilde(e[1:]))
-
-Defo_M = []
-Defo_N = []
-for n in range(len(time)):
-    e = motion_O[3:, n]
-    R = np.eye(3) + 2*e[0]*tilde(e[1:]) + 2*np.matmul(tilde(e[1:]), tilde(e[1:]))
-    x_rb = xyz_O[:, n] + np.matmul(np.matmul(R, np.transpose(R0)), xyz_M[:, 0] - xyz_O[:, 0])
-    defo = np.matmul(np.transpose(R), xyz_M[:, n] - x_rb)
-    Defo_M.append(defo)
-
-    e = motion_B[3:, n]
-    R = np.eye(3) + 2*e[0]*tilde(e[1:]) + 2*np.matmul(tilde(e[1:]), tilde(e[1:]))
-    x_rb = xyz_B[:, n] + np.matmul(np.matmul(R, np.transpose(R0)), xyz_N[:, 0] - xyz_B[:, 0])
-    defo = np.matmul(np.transpose(R), xyz_N[:, n] - x_rb)
-    Defo_N.append(defo)
-
-Defo_M = np.array(Defo_M)
-Defo_N = np.array(Defo_N)
+from mb_sef_py.utils import Results
+
+results = Results("beam_slidercrankTiso.h5")
+
+time, xyz_O = results.get_positions("node_0/MOTION")
+_, xyz_M = results.get_positions("node_M/MOTION")
+_, xyz_B = results.get_positions("node_Br/MOTION")
+_, xyz_N = results.get_positions("node_N/MOTION")
+_, R_O = results.get_rotation_matrices("node_0/MOTION")
+_, R_B = results.get_rotation_matrices("node_Br/MOTION")
+R0 = R_O[0]
+
+x_rb = xyz_O + np.matmul(np.matmul(R_O, np.transpose(R0)), xyz_M[0] - xyz_O[0])
+Defo_M = np.einsum('nji,nj->ni', R_O, xyz_M - x_rb)
+
+x_rb = xyz_B + np.matmul(np.matmul(R_B, np.transpose(R0)), xyz_N[0] - xyz_B[0])
+Defo_N = np.einsum('nji,nj->ni', R_B, xyz_N - x_rb)
 
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
 ax1.plot(time, Defo_M[:, 1])
@@ -0,0 +1,77 @@
+import numpy as np
+
+from mb_sef_py.core import Model, NodalFrame
+from mb_sef_py.elements import BeamProperties_EIGJ, ClampedFrameProperties, discretize_beam
+from mb_sef_py.math import Frame
+from mb_sef_py.solvers import StaticParameters, StaticSolver, TimeIntegrationParameters, GeneralizedAlpha
+from mb_sef_py.utils import Logger, SensorNode, LogNodalFields
+
+
+def build_model(refinement=1):
+    model = Model()
+
+    E, nu = 2.1e9, 0.3
+    G = E/(2 * (1. + nu))
+    rho = 7.8e3
+    r = 1.e-2
+    A, I = np.pi * r**2, 0.25 * np.pi * r**4
+
+    beam_props = BeamProperties_EIGJ(EA=E*A, GA_1=G*A, GA_2=G*A, GJ=G*2*I, EI_1=E*I, EI_2=E*I,
+                                     m=rho*A, m_11=rho*2*I, m_22=rho*I, m_33=rho*I)
+    beam_props.gravity = np.array([0., -9.81, 0.])
+
+    node_0 = model.add_node(NodalFrame, Frame(x=np.array([0., 0., 0.])))
+    node_1 = model.add_node(NodalFrame, Frame(x=np.array([1., 0., 0.])))
+    node_1.set_initial_velocity(np.array([0., 0., 1.e-2, 0., 0., 0.]))
+
+    model.add_element(ClampedFrameProperties(), node_0)
+    discretize_beam(model, node_0, node_1, refinement * 10, beam_props)
+    return model, node_1
+
+
+def build_static_solver(model, number_of_steps=3):
+    static_parameters = StaticParameters()
+    static_parameters.T = 1.
+    static_parameters.h = 1. / number_of_steps
+    return StaticSolver(model, static_parameters)
+
+
+def build_integrator(model, node, file_name='beam_static_preload', T=0.05, adaptive=False):
+    logger = Logger(file_name, periodicity=1)
+    logger.add_sensor(SensorNode(node, LogNodalFields.MOTION))
+    logger.add_sensor(SensorNode(node, LogNodalFields.VELOCITY))
+
+    time_integration_parameters = TimeIntegrationParameters()
+    time_integration_parameters.rho = .5
+    time_integration_parameters.T = T
+    time_integration_parameters.h = 1.e-3
+    time_integration_parameters.adaptive = adaptive
+    return GeneralizedAlpha(model, time_integration_parameters, logger)
+
+
+def check_static_to_dynamic_handoff(number_of_steps=3, adaptive=False):
+    model, node = build_model()
+    build_static_solver(model, number_of_steps).solve()
+    x_static = np.copy(node.frame[model.current_configuration].x)
+
+    integrator = build_integrator(model, node, adaptive=adaptive)
+    integrator.solve()
+
+    import h5py
+    with h5py.File(integrator.logger.file_name + '.h5', 'r') as file:
+        time = file['time'][:]
+        motion = file['node_1/MOTION'][:]
+        velocity = file['node_1/VELOCITY'][:]
+
+    assert np.allclose(motion[:3, 0], x_static, atol=1.e-6), (motion[:3, 0], x_static)
+    assert np.allclose(velocity[:, 0], node.v0, atol=1.e-6), velocity[:, 0]
+    assert time[0] == 0. and abs(time[-1] - integrator.tip.T) < 1.e-6 and integrator.number_of_steps > 0
+    assert model.load_factor == 1.
+    assert np.max(np.abs(motion[1, :] - x_static[1])) < 1.e-2 * abs(x_static[1]), np.ptp(motion[1, :])
+    print('static tip: ', x_static, '; dynamic steps: ', integrator.number_of_steps)
+
+
+if __name__ == '__main__':
+    check_static_to_dynamic_handoff(number_of_steps=3)
+    check_static_to_dynamic_handoff(number_of_steps=4)
+    check_static_to_dynamic_handoff(number_of_steps=3, adaptive=True)
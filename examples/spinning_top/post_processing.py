@@ -1,14 +1,12 @@
-import h5py
-import numpy as np
 import matplotlib.pyplot as plt
 
+from mb_sef_py.utils import Results
 
-file_name = "spinning_top.h5"
-file = h5py.File(file_name)
 
-time = np.array(file["time"]).reshape(-1, 1)
-energy = np.array(file["mechanical_power"]).reshape(-1, 1)
-number_of_iterations = np.array(file["number_of_iterations"]).reshape(-1, 1)
+results = Results("spinning_top.h5")
+
+time, energy = results.read("mechanical_power")
+_, number_of_iterations = results.read("number_of_iterations")
 
 _, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
 ax1.plot(time, energy)
@@ -22,10 +20,8 @@ ax2.set_ylabel(r'number of iterations [-]', rotation='vertical')
 ax2.grid()
 
 
-motion_1 = file["node_1/MOTION"]
-velocity_1 = file["node_1/VELOCITY"]
-xyz = np.array(motion_1[:3, :])
-v_xyz = np.array(velocity_1[:3, :])
+_, xyz = results.read("node_1/MOTION", rows=slice(0, 3))
+_, v_xyz = results.read("node_1/VELOCITY", rows=slice(0, 3))
 
 _, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
 ax1.plot(time, xyz[0, :] - xyz[0, 0], 'b-')
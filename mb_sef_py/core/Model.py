@@ -1,9 +1,11 @@
 import numpy as np
 from scipy.sparse import csc_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
 from .TypeOfVariables import TypeOfVariables
 from .TypeOfAnalysis import TypeOfAnalysis
 from ..elements.ResidueReturn import ResidueReturn
+from ..utils.Profiler import Profiler
 
 
 def dict_of_assembly_coefs():
@@ -15,21 +17,37 @@ def dict_of_assembly_coefs():
     }
 
 
-class TripletsSparseRepresentation:
-    def __init__(self, matrix=None, loc_dof=None):
-        self.row = []
-        self.col = []
-        if matrix is None:
-            self.data = []
+class SparseAssemblyPattern:
+    def __init__(self, size, list_loc_dof):
+        self.size = size
+
+        keys = []
+        for loc_dof in list_loc_dof:
+            loc_dof = np.asarray(loc_dof, dtype=np.int64)
+            keys.append((loc_dof[np.newaxis, :] * size + loc_dof[:, np.newaxis]).ravel())
+        offsets = np.cumsum([len(k) for k in keys])[:-1]
+        if len(keys):
+            unique_keys, inverse = np.unique(np.concatenate(keys), return_inverse=True)
         else:
-            self.data = list(matrix.flatten())
-            self.row = [i for i in loc_dof for _ in loc_dof]
-            self.col = [j for _ in loc_dof for j in loc_dof]
+            unique_keys, inverse = np.zeros((0,), dtype=np.int64), np.zeros((0,), dtype=np.int64)
+
+        indices = (unique_keys % size).astype(np.int32)
+        indptr = np.searchsorted(unique_keys // size, np.arange(size + 1)).astype(np.int32)
+        self.matrix = csc_matrix((np.zeros((len(unique_keys),)), indices, indptr), shape=(size, size))
+        self.data = self.matrix.data
+        self.scatter_maps = np.split(inverse.ravel(), offsets)
+
+    def get_number_of_nonzeros(self):
+        return len(self.data)
+
+    def reset(self):
+        self.data[:] = 0.
+
+    def add_with_matrix_and_scatter_map(self, matrix, scatter_map):
+        self.data[scatter_map] += matrix.ravel()
 
-    def add_with_matrix_and_loc_dof(self, matrix, loc_dof):
-        self.data += list(matrix.flatten())
-        self.row += [i for i in loc_dof for _ in loc_dof]
-        self.col += [j for _ in loc_dof for j in loc_dof]
+    def add_with_matrices_and_scatter_map(self, matrices, scatter_map):
+        self.data += np.bincount(scatter_map, weights=matrices.ravel(), minlength=len(self.data))
 
 
 class Model:
@@ -38,24 +56,40 @@ class Model:
         self.dof_offsets = None
 
         self.list_nodes = [[] for _ in range(TypeOfVariables.Count)]
+        self.list_node_groups = [[] for _ in range(TypeOfVariables.Count)]
+        self.list_single_nodes = [[] for _ in range(TypeOfVariables.Count)]
         self.list_elements = []
+        self.use_element_groups = True
+        self.list_element_groups = []
+        self.group_scatter_maps = []
+        self.list_single_elements = []
+        self.single_scatter_maps = []
+        self.list_power_elements = []
+        self.power_loc_dof = None
+        self.dof_ordering = None
+        self.dof_permutation = None
 
         self.is_meshed = False
         self.is_core_initialized = False
 
         self.time = 0.
+        self.previous_time = 0.
         self.previous_configuration = 0
         self.current_configuration = 0
+        self.kinematics_version = 0
+        self.load_factor = 1.
+        self.load_cache = {}
 
         self.size_res = 0
         self.res = None
-        self.st_triplets = None
+        self.st_pattern = None
         self.analysis_type = TypeOfAnalysis.NONE
         self.inc = None
         self.v = None
         self.v_dot = None
 
         self.mechanical_power = 0.
+        self.profiler = Profiler(enabled=False)
 
     def add_node(self, node_type, *args):
         new_node = node_type(*args)
@@ -107,8 +141,7 @@ class Model:
         self.analysis_type = analysis_type
         self.mesh()
 
-        self.previous_configuration = 0
-        self.current_configuration = 1
+        self.load_cache.clear()
 
         if self.analysis_type != TypeOfAnalysis.STATIC:
             n_fm = self.number_of_dofs[TypeOfVariables.MOTION] + self.number_of_dofs[TypeOfVariables.RELATIVE_MOTION]
@@ -118,7 +151,11 @@ class Model:
             self.v = None
             self.v_dot = None
 
-        if not self.is_core_initialized:
+        if self.is_core_initialized:
+            self.restart_from_current_configuration()
+        else:
+            self.previous_configuration = 0
+            self.current_configuration = 1
             self.time = 0.
             self.mechanical_power = 0.
 
@@ -129,42 +166,228 @@ class Model:
             for element in self.list_elements:
                 element.initialize(self)
 
+            self.build_node_groups()
+
             self.is_core_initialized = True
 
             n_motion = self.get_number_of_motion_dofs()
             n_lm = self.get_number_of_lagrange_multipliers()
             self.size_res = n_motion + n_lm
             self.res = np.zeros((n_motion + n_lm,))
-            self.st_triplets = TripletsSparseRepresentation()
+            self.st_pattern = SparseAssemblyPattern(self.size_res,
+                                                    [element.loc_dof for element in self.list_elements])
+            self.build_element_groups()
+            self.dof_permutation = self.compute_dof_permutation()
 
         self.inc = np.zeros((self.size_res,))
 
+    def restart_from_current_configuration(self):
+        self.previous_configuration = 1 - self.current_configuration
+        self.time = 0.
+        self.previous_time = 0.
+        self.load_factor = 1.
+        self.kinematics_version += 1
+        for field in range(TypeOfVariables.Count):
+            for node in self.list_nodes[field]:
+                node.apply_initial_velocity(self)
+        for element in self.list_elements:
+            element.reset_time(self)
+
+    def compute_dof_permutation(self):
+        if self.dof_ordering is None:
+            return None
+        if self.dof_ordering == 'RCM':
+            pattern = self.st_pattern.matrix
+            graph = csc_matrix((np.ones_like(pattern.data), pattern.indices, pattern.indptr), shape=pattern.shape)
+            return np.asarray(reverse_cuthill_mckee(graph, symmetric_mode=True), dtype=np.int64)
+        raise ValueError('Unknown dof ordering: ' + str(self.dof_ordering))
+
+    def build_node_groups(self):
+        for field in range(TypeOfVariables.Count):
+            self.list_node_groups[field], self.list_single_nodes[field] = [], []
+
+            grouped_nodes = {}
+            for node in self.list_nodes[field]:
+                group_type = node.get_node_group_type()
+                if group_type is None:
+                    self.list_single_nodes[field].append(node)
+                else:
+                    grouped_nodes.setdefault(group_type, []).append(node)
+
+            for group_type, list_grouped in grouped_nodes.items():
+                group = group_type(list_grouped)
+                group.initialize(self)
+                self.list_node_groups[field].append(group)
+
+    def build_element_groups(self):
+        self.list_element_groups, self.group_scatter_maps = [], []
+        self.list_single_elements, self.single_scatter_maps = [], []
+
+        grouped_elements = {}
+        for element, scatter_map in zip(self.list_elements, self.st_pattern.scatter_maps):
+            group_type = element.get_element_group_type() if self.use_element_groups else None
+            if group_type is None:
+                self.list_single_elements.append(element)
+                self.single_scatter_maps.append(scatter_map)
+            else:
+                grouped_elements.setdefault(group_type, []).append((element, scatter_map))
+
+        for group_type, list_grouped in grouped_elements.items():
+            group = group_type([element for element, _ in list_grouped])
+            group.initialize(self)
+            self.list_element_groups.append(group)
+            self.group_scatter_maps.append(np.concatenate([scatter_map for _, scatter_map in list_grouped]))
+
+        self.list_power_elements = [element for element in self.list_single_elements
+                                    if element.has_mechanical_power()]
+        self.power_loc_dof = np.concatenate([element.loc_dof for element in self.list_power_elements] +
+                                            [group.loc_dof.ravel() for group in self.list_element_groups] +
+                                            [np.zeros((0,), dtype=int)])
+
     def assemble_res_st(self, coefs, solver_param):
+        ref = self.assemble_res(solver_param)
+        self.assemble_st(coefs)
+        return ref
+
+    def assemble_res(self, solver_param):
+        self.res[:] = 0.
+        self.mechanical_power = None
+        ref = self.assemble_single_elements_res(solver_param)
+        for group in self.list_element_groups:
+            ref = ref + self.assemble_group_res(group, solver_param)
+        return ref
+
+    def assemble_single_elements_res(self, solver_param):
         ref = ResidueReturn()
-        self.res *= 0.
-        self.st_triplets = TripletsSparseRepresentation()
-        self.mechanical_power = 0.
-        for element in self.list_elements:
-            ref = ref + element.assemble_res(self, solver_param)
-            self.res[element.loc_dof] += element.res[:]
-            element.assemble_st(self, coefs)
-            self.st_triplets.add_with_matrix_and_loc_dof(element.st, element.loc_dof)
-            self.mechanical_power += element.get_mechanical_power(self)
+        profiler = self.profiler
+        for element in self.list_single_elements:
+            with profiler.timer(element.__class__.__name__ + '.assemble_res'):
+                ref = ref + element.assemble_res(self, solver_param)
+                self.res[element.loc_dof] += element.res[:]
+        return ref
+
+    def assemble_group_res(self, group, solver_param):
+        with self.profiler.timer(group.__class__.__name__ + '.assemble_res'):
+            ref = group.assemble_res(self, solver_param)
+            self.res += np.bincount(group.loc_dof.ravel(), weights=group.res.ravel(), minlength=self.size_res)
         return ref
 
+    def get_mechanical_power(self):
+        if self.mechanical_power is None:
+            if self.v is None:
+                self.mechanical_power = 0.
+            else:
+                res = np.concatenate([element.res for element in self.list_power_elements] +
+                                     [group.res.ravel() for group in self.list_element_groups] + [np.zeros((0,))])
+                self.mechanical_power = np.dot(self.v[self.power_loc_dof], res)
+        return self.mechanical_power
+
+    def assemble_st(self, coefs):
+        self.st_pattern.reset()
+        self.assemble_single_elements_st(coefs)
+        for group, scatter_map in zip(self.list_element_groups, self.group_scatter_maps):
+            self.assemble_group_st(group, scatter_map, coefs)
+
+    def assemble_single_elements_st(self, coefs):
+        profiler = self.profiler
+        for element, scatter_map in zip(self.list_single_elements, self.single_scatter_maps):
+            with profiler.timer(element.__class__.__name__ + '.assemble_st'):
+                element.assemble_st(self, coefs)
+                self.st_pattern.add_with_matrix_and_scatter_map(element.st, scatter_map)
+
+    def assemble_group_st(self, group, scatter_map, coefs):
+        with self.profiler.timer(group.__class__.__name__ + '.assemble_st'):
+            group.assemble_st(self, coefs)
+            self.st_pattern.add_with_matrices_and_scatter_map(group.st, scatter_map)
+
     def build_iteration_matrix_from_sparse_representation(self):
-        return csc_matrix((self.st_triplets.data, (self.st_triplets.row, self.st_triplets.col)),
-                          shape=(self.size_res, self.size_res))
+        return self.st_pattern.matrix
 
     def kinematic_update(self, fields=range(TypeOfVariables.Count)):
+        self.kinematics_version += 1
         for field in fields:
-            for node in self.list_nodes[field]:
+            for group in self.list_node_groups[field]:
+                group.kinematic_update(self.inc, self.previous_configuration, self.current_configuration)
+            for node in self.list_single_nodes[field]:
                 i0 = self.dof_offsets[field] + node.get_first_index_dof()
                 i1 = i0 + node.get_number_of_dofs()
                 node.kinematic_update(self.inc[i0:i1], self.previous_configuration, self.current_configuration)
 
+    def evaluate_load(self, function, abscissae=None, vectorized=False):
+        key = (id(function), None if abscissae is None else tuple(abscissae))
+        entry = self.load_cache.get(key)
+        if entry is not None:
+            return entry[1]
+
+        if abscissae is None:
+            value = function(self.time)
+        elif vectorized:
+            value = np.asarray(function(np.asarray(abscissae), self.time))
+        else:
+            value = np.array([function(s, self.time) for s in abscissae])
+        self.load_cache[key] = (function, value)
+        return value
+
     def advance_time_step(self, step_size):
+        self.previous_time = self.time
         self.time += step_size
+        self.kinematics_version += 1
+        self.load_cache.clear()
         tmp = self.previous_configuration
         self.previous_configuration = self.current_configuration
         self.current_configuration = tmp
+
+    def reject_time_step(self):
+        self.time = self.previous_time
+        self.kinematics_version += 1
+        self.load_cache.clear()
+        tmp = self.previous_configuration
+        self.previous_configuration = self.current_configuration
+        self.current_configuration = tmp
+        for element in self.list_elements:
+            element.reject_time_step(self)
+
+    def get_state(self):
+        state = {
+            'time': self.time,
+            'previous_time': self.previous_time,
+            'load_factor': self.load_factor,
+            'mechanical_power': self.get_mechanical_power(),
+            'current_configuration': self.current_configuration,
+        }
+        if self.v is not None:
+            state['v'], state['v_dot'] = np.copy(self.v), np.copy(self.v_dot)
+        for field in range(TypeOfVariables.Count):
+            state['coordinates_' + str(field)] = np.array(
+                [np.concatenate([node.get_motion_coordinates(configuration) for node in self.list_nodes[field]] +
+                                [np.zeros((0,))]) for configuration in range(2)])
+        for i, element in enumerate(self.list_elements):
+            for name, value in element.get_state().items():
+                state['element_' + str(i) + '/' + name] = value
+        return state
+
+    def set_state(self, state):
+        self.time = float(state['time'])
+        self.previous_time = float(state['previous_time'])
+        self.load_cache.clear()
+        self.load_factor = float(state['load_factor'])
+        self.mechanical_power = float(state['mechanical_power'])
+        self.current_configuration = int(state['current_configuration'])
+        self.previous_configuration = 1 - self.current_configuration
+        if self.v is not None:
+            self.v[:], self.v_dot[:] = state['v'], state['v_dot']
+
+        for field in range(TypeOfVariables.Count):
+            coordinates = state['coordinates_' + str(field)]
+            i0 = 0
+            for node in self.list_nodes[field]:
+                i1 = i0 + node.get_number_of_motion_coordinates()
+                for configuration in range(2):
+                    node.set_motion_coordinates(configuration, coordinates[configuration, i0:i1])
+                i0 = i1
+        self.build_node_groups()
+
+        for i, element in enumerate(self.list_elements):
+            prefix = 'element_' + str(i) + '/'
+            element.set_state({name[len(prefix):]: value for name, value in state.items() if name.startswith(prefix)})
+        self.kinematics_version += 1
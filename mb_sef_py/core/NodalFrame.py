@@ -1,8 +1,58 @@
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from .TypeOfVariables import TypeOfVariables
 from .Node import Node
-from ..math.SE3 import Frame
+from .NodeGroup import NodeGroup
+from ..math.SE3 import Frame, FrameArray
+from ..math.SO3 import UnitQuaternion, UnitQuaternionView
+
+
+class NodalFrameGroup(NodeGroup):
+    def __init__(self, list_nodes):
+        NodeGroup.__init__(self, list_nodes)
+        self.frames = None
+        self.increment = None
+
+    def initialize(self, model):
+        NodeGroup.initialize(self, model)
+        n_nodes = self.get_number_of_nodes()
+        self.frames = [FrameArray.from_frames([node.frame[configuration] for node in self.list_nodes])
+                       for configuration in range(2)]
+        self.increment = FrameArray(n_nodes)
+        for i, node in enumerate(self.list_nodes):
+            node.frame = [Frame(x=frames.x[i], q=UnitQuaternionView(frames.q.q[i])) for frames in self.frames]
+
+    def get_motion_coordinates(self, configuration):
+        return np.hstack((self.frames[configuration].x, self.frames[configuration].q.q)).ravel()
+
+    def get_parameters(self, inc):
+        return inc[self.index_dof].reshape((-1, 6))
+
+    def kinematic_update(self, inc, previous_index, current_index):
+        FrameArray.get_frame_from_parameters(self.get_parameters(inc), out=self.increment)
+        self.frames[previous_index].multiply(self.increment, out=self.frames[current_index])
+
+
+class NodalRelativeFrameGroup(NodalFrameGroup):
+    def __init__(self, list_nodes):
+        NodalFrameGroup.__init__(self, list_nodes)
+        self.A = None
+
+    def initialize(self, model):
+        NodalFrameGroup.initialize(self, model)
+        rows, cols, data = [], [], []
+        j0 = 0
+        for i, node in enumerate(self.list_nodes):
+            n_rel_dof = node.get_number_of_dofs()
+            rows += [6 * i + k for k in range(6) for _ in range(n_rel_dof)]
+            cols += [j0 + j for _ in range(6) for j in range(n_rel_dof)]
+            data += list(node.A.flatten())
+            j0 += n_rel_dof
+        self.A = csr_matrix((data, (rows, cols)), shape=(6 * self.get_number_of_nodes(), j0))
+
+    def get_parameters(self, inc):
+        return (self.A @ inc[self.index_dof]).reshape((-1, 6))
 
 
 class NodalFrame(Node):
@@ -23,9 +73,17 @@ class NodalFrame(Node):
         frame = self.frame[configuration]
         return np.block([frame.x, frame.q.e0, frame.q.e])
 
+    def set_motion_coordinates(self, configuration, coordinates):
+        self.frame[configuration] = Frame(x=np.copy(coordinates[:3]),
+                                          q=UnitQuaternion(e0=coordinates[3], e=np.copy(coordinates[4:])))
+
     def get_number_of_dofs(self):
         return 6
 
+    @staticmethod
+    def get_node_group_type():
+        return NodalFrameGroup
+
     def initialize(self, model):
         Node.initialize(self, model)
         self.frame = [Frame(ref_frame=self.frame_0), Frame(ref_frame=self.frame_0)]
@@ -50,5 +108,9 @@ class NodalRelativeFrame(NodalFrame):
     def get_number_of_dofs(self):
         return self.A.shape[1]
 
+    @staticmethod
+    def get_node_group_type():
+        return NodalRelativeFrameGroup
+
     def kinematic_update(self, inc, previous_index, current_index):
         self.frame[current_index] = self.frame[previous_index] * Frame.get_frame_from_parameters(np.matmul(self.A, inc))
@@ -7,6 +7,8 @@ class Node(abc.ABC):
 
         self.node_number = None
         self.first_index_dof = None
+        self.group = None
+        self.index_in_group = None
 
         self.v0 = None
 
@@ -19,10 +21,18 @@ class Node(abc.ABC):
     def get_number_of_dofs(self):
         pass
 
+    @staticmethod
+    def get_node_group_type():
+        return None
+
     @abc.abstractmethod
     def get_motion_coordinates(self, configuration):
         pass
 
+    @abc.abstractmethod
+    def set_motion_coordinates(self, configuration, coordinates):
+        pass
+
     def get_number_of_motion_coordinates(self):
         return self.get_number_of_dofs()
 
@@ -43,7 +53,10 @@ class Node(abc.ABC):
         self.v0 = v0
 
     def initialize(self, model):
-        if self.v0 is not None:
+        self.apply_initial_velocity(model)
+
+    def apply_initial_velocity(self, model):
+        if self.v0 is not None and model.v is not None:
             i0 = model.dof_offsets[self.get_field()] + self.get_first_index_dof()
             i1 = i0 + self.get_number_of_dofs()
             model.v[i0:i1] = self.v0[:]
@@ -0,0 +1,31 @@
+import abc
+import numpy as np
+
+
+class NodeGroup(abc.ABC):
+    def __init__(self, list_nodes):
+        self.list_nodes = list_nodes
+        self.index_dof = None
+        self.coordinate_offsets = None
+
+    def get_number_of_nodes(self):
+        return len(self.list_nodes)
+
+    def initialize(self, model):
+        index_dof = []
+        for i, node in enumerate(self.list_nodes):
+            i0 = model.dof_offsets[node.get_field()] + node.get_first_index_dof()
+            index_dof.append(np.arange(i0, i0 + node.get_number_of_dofs()))
+            node.group, node.index_in_group = self, i
+        self.index_dof = np.concatenate(index_dof)
+        self.coordinate_offsets = np.cumsum([0] + [node.get_number_of_motion_coordinates() for node in self.list_nodes])
+
+    def get_motion_coordinates(self, configuration):
+        return np.concatenate([node.get_motion_coordinates(configuration) for node in self.list_nodes])
+
+    def get_motion_coordinates_indices(self, node):
+        return np.arange(self.coordinate_offsets[node.index_in_group], self.coordinate_offsets[node.index_in_group + 1])
+
+    @abc.abstractmethod
+    def kinematic_update(self, inc, previous_index, current_index):
+        pass
@@ -2,6 +2,33 @@ import numpy as np
 
 from .TypeOfVariables import TypeOfVariables
 from .Node import Node
+from .NodeGroup import NodeGroup
+
+
+class NodeLagrangeMultipliersGroup(NodeGroup):
+    def __init__(self, list_nodes):
+        NodeGroup.__init__(self, list_nodes)
+        self.lambd = None
+        self.scaling = None
+
+    def initialize(self, model):
+        NodeGroup.initialize(self, model)
+        self.lambd = np.array([np.concatenate([node.lambd[configuration] for node in self.list_nodes])
+                               for configuration in range(2)])
+        self.scaling = np.concatenate([np.full((node.get_number_of_dofs(),), node.scaling)
+                                       for node in self.list_nodes])
+        i0 = 0
+        for node in self.list_nodes:
+            i1 = i0 + node.get_number_of_dofs()
+            node.lambd = [self.lambd[0, i0:i1], self.lambd[1, i0:i1]]
+            i0 = i1
+
+    def get_motion_coordinates(self, configuration):
+        return self.lambd[configuration]
+
+    def kinematic_update(self, inc, previous_index, current_index):
+        np.multiply(self.scaling, inc[self.index_dof], out=self.lambd[current_index])
+        self.lambd[current_index] += self.lambd[previous_index]
 
 
 class NodeLagrangeMultipliers(Node):
@@ -15,9 +42,16 @@ class NodeLagrangeMultipliers(Node):
     def get_field():
         return TypeOfVariables.LAGRANGE_MULTIPLIER
 
+    @staticmethod
+    def get_node_group_type():
+        return NodeLagrangeMultipliersGroup
+
     def get_motion_coordinates(self, configuration):
         return self.lambd[configuration]
 
+    def set_motion_coordinates(self, configuration, coordinates):
+        self.lambd[configuration] = np.copy(coordinates)
+
     def get_number_of_dofs(self):
         return self.number_of_multipliers
 
@@ -1,9 +1,32 @@
 import numpy as np
 
 from .Node import Node
+from .NodeGroup import NodeGroup
 from .TypeOfVariables import TypeOfVariables
 
 
+class NodeRnGroup(NodeGroup):
+    def __init__(self, list_nodes):
+        NodeGroup.__init__(self, list_nodes)
+        self.x = None
+
+    def initialize(self, model):
+        NodeGroup.initialize(self, model)
+        self.x = np.array([np.concatenate([node.x[configuration] for node in self.list_nodes])
+                           for configuration in range(2)])
+        i0 = 0
+        for node in self.list_nodes:
+            i1 = i0 + node.get_number_of_dofs()
+            node.x = [self.x[0, i0:i1], self.x[1, i0:i1]]
+            i0 = i1
+
+    def get_motion_coordinates(self, configuration):
+        return self.x[configuration]
+
+    def kinematic_update(self, inc, previous_index, current_index):
+        np.add(self.x[previous_index], inc[self.index_dof], out=self.x[current_index])
+
+
 class NodeRn(Node):
     def __init__(self, x0, name):
         Node.__init__(self, name)
@@ -18,9 +41,16 @@ class NodeRn(Node):
     def get_field():
         return TypeOfVariables.MOTION
 
+    @staticmethod
+    def get_node_group_type():
+        return NodeRnGroup
+
     def get_motion_coordinates(self, configuration):
         return self.x[configuration]
 
+    def set_motion_coordinates(self, configuration, coordinates):
+        self.x[configuration] = np.copy(coordinates)
+
     def initialize(self, model):
         Node.initialize(self, model)
         self.x = [self.x0[:], self.x0[:]]
@@ -35,3 +65,16 @@ class NodeR3(NodeRn):
 
     def get_number_of_dofs(self):
         return 3
+
+
+class NodeRelativeRn(NodeRn):
+    def __init__(self, number_of_dofs, x0=None, name=None):
+        self.number_of_dofs = number_of_dofs
+        NodeRn.__init__(self, x0, name)
+
+    @staticmethod
+    def get_field():
+        return TypeOfVariables.RELATIVE_MOTION
+
+    def get_number_of_dofs(self):
+        return self.number_of_dofs
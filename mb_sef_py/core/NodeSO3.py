@@ -1,8 +1,32 @@
 import numpy as np
 
 from .Node import Node
+from .NodeGroup import NodeGroup
 from .TypeOfVariables import TypeOfVariables
-from ..math import UnitQuaternion
+from ..math import UnitQuaternion, QuaternionArray
+from ..math.SO3 import UnitQuaternionView
+
+
+class NodeSO3Group(NodeGroup):
+    def __init__(self, list_nodes):
+        NodeGroup.__init__(self, list_nodes)
+        self.R = None
+        self.increment = None
+
+    def initialize(self, model):
+        NodeGroup.initialize(self, model)
+        self.R = [QuaternionArray.from_unit_quaternions([node.R[configuration] for node in self.list_nodes])
+                  for configuration in range(2)]
+        self.increment = QuaternionArray(self.get_number_of_nodes())
+        for i, node in enumerate(self.list_nodes):
+            node.R = [UnitQuaternionView(R.q[i]) for R in self.R]
+
+    def get_motion_coordinates(self, configuration):
+        return self.R[configuration].q.ravel()
+
+    def kinematic_update(self, inc, previous_index, current_index):
+        QuaternionArray.get_unitquat_from_parameters(inc[self.index_dof].reshape((-1, 3)), out=self.increment)
+        self.R[previous_index].multiply(self.increment, out=self.R[current_index])
 
 
 class NodeSO3(Node):
@@ -20,11 +44,18 @@ class NodeSO3(Node):
 
     def get_motion_coordinates(self, configuration):
         R = self.R[configuration]
-        return np.block([R.q.e0, R.q.e])
+        return np.block([R.e0, R.e])
+
+    def set_motion_coordinates(self, configuration, coordinates):
+        self.R[configuration] = UnitQuaternion(e0=coordinates[0], e=np.copy(coordinates[1:]))
 
     def get_number_of_dofs(self):
         return 3
 
+    @staticmethod
+    def get_node_group_type():
+        return NodeSO3Group
+
     def initialize(self, model):
         Node.initialize(self, model)
         self.R = [UnitQuaternion(ref_unit_quaternion=self.R_0),
@@ -1,6 +1,7 @@
 import abc
 import numpy as np
 
+from .BeamElementGroup import BeamElementGroup
 from .Element import Element
 from .ElementProperties import ElementProperties
 from ..core import NodalFrame
@@ -18,6 +19,7 @@ class BeamProperties(ElementProperties):
         self.K, self.M = self.get_beam_matrices()
         self.distributed_load = None
         self.distributed_follower_load = None
+        self.vectorized_distributed_loads = False
         self.gravity = None
 
     @staticmethod
@@ -106,6 +108,10 @@ class BeamElement(Element):
     def get_number_of_dofs(self):
         return 12
 
+    @staticmethod
+    def get_element_group_type():
+        return BeamElementGroup
+
     def initialize(self, model):
         Element.initialize(self, model)
         HA = self.list_nodes[TypeOfVariables.MOTION][0].frame_ref
@@ -113,34 +119,47 @@ class BeamElement(Element):
         self.d0 = Frame.get_parameters_from_frame(HA.get_inverse() * HB)
         self.L = np.linalg.norm(self.d0[:3])
 
-    def assemble_res_impl(self, model, solver_params):
+    def compute_kinematics(self, model):
         HA = self.list_nodes[TypeOfVariables.MOTION][0].frame[model.current_configuration]
         HB = self.list_nodes[TypeOfVariables.MOTION][1].frame[model.current_configuration]
 
         d = Frame.get_parameters_from_frame(HA.get_inverse() * HB)
         P = np.zeros((6, 12))
         P[:, :6], P[:, 6:] = -Frame.get_inverse_tangent_operator(-d), Frame.get_inverse_tangent_operator(d)
+        return HA, d, P
+
+    def assemble_res_impl(self, model, solver_params):
+        HA, d, P = self.get_kinematics(model)
         PTK = np.matmul(np.transpose(P), self.elem_props.K / self.L)
 
         self.res = np.matmul(PTK, d - self.d0)
         self.kt = np.matmul(PTK, P)
 
         self.ct, self.mt = np.zeros((12, 12)), np.zeros((12, 12))
+        if model.analysis_type != TypeOfAnalysis.STATIC:
+            v, v_dot = model.v[self.loc_dof], model.v_dot[self.loc_dof]
+        s_gps = 0.5 * (np.asarray(self.gps.xw[0]) + 1.)
+        vectorized = self.elem_props.vectorized_distributed_loads
+        if self.elem_props.distributed_load is not None:
+            loads = model.evaluate_load(self.elem_props.distributed_load, s_gps, vectorized)
+        if self.elem_props.distributed_follower_load is not None:
+            follower_loads = model.evaluate_load(self.elem_props.distributed_follower_load, s_gps, vectorized)
+
         Q = np.zeros((6, 12))
-        for x, w in zip(*self.gps.xw):
-            s = 0.5 * (x + 1.)
+        for i_gp, (s, w) in enumerate(zip(s_gps, self.gps.xw[1])):
             T_star = s * np.matmul(Frame.get_tangent_operator(s * d), P[:, 6:])
             Q[:, :6], Q[:, 6:] = np.eye(6) - T_star, T_star
 
             distributed_load, distributed_load_flag = np.zeros((6,)), False
             if self.elem_props.distributed_load is not None:
                 distributed_load_flag = True
-                distributed_load += self.elem_props.distributed_load(s, model.time)
+                distributed_load += loads[i_gp]
             if self.elem_props.gravity is not None:
                 distributed_load_flag = True
                 distributed_load[:3] += self.elem_props.M[0, 0] * self.elem_props.gravity
 
             if distributed_load_flag:
+                distributed_load *= model.load_factor
                 H = HA * Frame.get_frame_from_parameters(s * d)
                 RT = np.transpose(H.q.get_rotation_matrix())
                 distributed_load[:3] = np.matmul(RT, distributed_load[:3])
@@ -151,14 +170,14 @@ class BeamElement(Element):
 
             if self.elem_props.distributed_follower_load is not None:
                 distributed_load_flag = True
-                distributed_load += self.elem_props.distributed_follower_load(s, model.time)
+                distributed_load += model.load_factor * follower_loads[i_gp]
 
             if distributed_load_flag:
                 self.res -= np.matmul(np.transpose(Q), (0.5 * w * self.L) * distributed_load)
 
-            if model.analysis_type == TypeOfAnalysis.DYNAMIC:
+            if model.analysis_type != TypeOfAnalysis.STATIC:
                 m_gp = self.elem_props.M * (0.5 * w * self.L)
-                v_gp = np.matmul(Q, model.v[self.loc_dof])
+                v_gp = np.matmul(Q, v)
                 mv_gp = np.matmul(m_gp, v_gp)
 
                 vgp_tilde6T = np.transpose(tilde6(v_gp))
@@ -166,16 +185,18 @@ class BeamElement(Element):
                 self.ct -= np.matmul(np.transpose(Q), np.matmul(np.matmul(vgp_tilde6T, m_gp) + breve6(mv_gp), Q))
 
                 QTM = np.matmul(np.transpose(Q), m_gp)
-                self.res += np.matmul(QTM, np.matmul(Q, model.v_dot[self.loc_dof]))
+                self.res += np.matmul(QTM, np.matmul(Q, v_dot))
                 self.mt += np.matmul(QTM, Q)
 
-    def assemble_kt_impl(self, model):
-        HA = self.list_nodes[TypeOfVariables.MOTION][0].frame[model.current_configuration]
-        HB = self.list_nodes[TypeOfVariables.MOTION][1].frame[model.current_configuration]
+    def get_number_of_internal_forces(self):
+        return 6
 
-        d = Frame.get_parameters_from_frame(HA.get_inverse() * HB)
-        P = np.zeros((6, 12))
-        P[:, :6], P[:, 6:] = -Frame.get_inverse_tangent_operator(-d), Frame.get_inverse_tangent_operator(d)
+    def get_internal_forces(self, model):
+        _, d, _ = self.get_kinematics(model)
+        return np.matmul(self.elem_props.K, d - self.d0) / self.L
+
+    def assemble_kt_impl(self, model):
+        _, d, P = self.get_kinematics(model)
         F = np.matmul(self.elem_props.K, d-self.d0)
         self.kt[:6, :] += np.matmul(Frame.get_derivative_inverse_transposed_tangent_operator(-d, F), P)
         self.kt[6:, :] += np.matmul(Frame.get_derivative_inverse_transposed_tangent_operator(d, F), P)
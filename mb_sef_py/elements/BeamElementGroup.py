@@ -0,0 +1,161 @@
+import numpy as np
+
+from .ElementGroup import ElementGroup
+from ..core.TypeOfAnalysis import TypeOfAnalysis
+from ..core.TypeOfVariables import TypeOfVariables
+from ..math.SE3 import FrameArray, tilde6_array, breve6_array
+from ..math.SO3 import tilde_array
+
+
+class BeamElementGroup(ElementGroup):
+    def __init__(self, list_elements):
+        ElementGroup.__init__(self, list_elements)
+
+        self.list_nodes_A = [element.list_nodes[TypeOfVariables.MOTION][0] for element in list_elements]
+        self.list_nodes_B = [element.list_nodes[TypeOfVariables.MOTION][1] for element in list_elements]
+
+        self.K = None
+        self.M = None
+        self.L = None
+        self.d0 = None
+        self.gravity_load = None
+        self.list_loaded_elements = None
+        self.list_follower_loaded_elements = None
+        self.list_distributed_loads = None
+        self.list_distributed_follower_loads = None
+
+        self.d = None
+        self.P = None
+        self.kt = None
+        self.ct = None
+        self.mt = None
+
+        self.gps = list_elements[0].gps
+
+    def initialize(self, model):
+        ElementGroup.initialize(self, model)
+        n_elem = self.get_number_of_elements()
+        self.K = np.array([element.elem_props.K for element in self.list_elements])
+        self.M = np.array([element.elem_props.M for element in self.list_elements])
+        self.L = np.array([element.L for element in self.list_elements])
+        self.d0 = np.array([element.d0 for element in self.list_elements])
+
+        self.gravity_load = np.zeros((n_elem, 3))
+        for i, element in enumerate(self.list_elements):
+            if element.elem_props.gravity is not None:
+                self.gravity_load[i, :] = element.elem_props.M[0, 0] * element.elem_props.gravity
+
+        self.list_loaded_elements = np.array([i for i, element in enumerate(self.list_elements)
+                                              if element.elem_props.gravity is not None or
+                                              element.elem_props.distributed_load is not None], dtype=int)
+        self.list_follower_loaded_elements = np.array([i for i, element in enumerate(self.list_elements)
+                                                       if element.elem_props.distributed_follower_load is not None],
+                                                      dtype=int)
+        self.list_distributed_loads = self.group_elements_by_load('distributed_load')
+        self.list_distributed_follower_loads = self.group_elements_by_load('distributed_follower_load')
+
+    def group_elements_by_load(self, load_name):
+        grouped_elements = {}
+        for i, element in enumerate(self.list_elements):
+            props = element.elem_props
+            function = getattr(props, load_name)
+            if function is not None:
+                key = (id(function), props.vectorized_distributed_loads)
+                grouped_elements.setdefault(key, (function, props.vectorized_distributed_loads, []))[2].append(i)
+        return [(function, vectorized, np.array(indices, dtype=int))
+                for function, vectorized, indices in grouped_elements.values()]
+
+    @staticmethod
+    def evaluate_distributed_loads(model, list_loads, s_gps):
+        return [(model.evaluate_load(function, s_gps, vectorized), indices)
+                for function, vectorized, indices in list_loads]
+
+    def assemble_res_impl(self, model, solver_params):
+        HA = FrameArray.from_frames([node.frame[model.current_configuration] for node in self.list_nodes_A])
+        HB = FrameArray.from_frames([node.frame[model.current_configuration] for node in self.list_nodes_B])
+
+        self.d = d = FrameArray.get_parameters_from_frame(HA.get_inverse() * HB)
+        n_elem = self.get_number_of_elements()
+        self.P = P = np.empty((n_elem, 6, 12))
+        FrameArray.get_inverse_tangent_operator(-d, out=P[:, :, :6])
+        P[:, :, :6] *= -1.
+        FrameArray.get_inverse_tangent_operator(d, out=P[:, :, 6:])
+        PT = np.swapaxes(P, 1, 2)
+        PTK = np.matmul(PT, self.K / self.L[:, np.newaxis, np.newaxis])
+
+        self.res = np.matmul(PTK, (d - self.d0)[:, :, np.newaxis])[:, :, 0]
+        self.kt = np.matmul(PTK, P)
+
+        self.ct, self.mt = np.zeros((n_elem, 12, 12)), np.zeros((n_elem, 12, 12))
+        if model.analysis_type != TypeOfAnalysis.STATIC:
+            v = model.v[self.loc_dof][:, :, np.newaxis]
+            v_dot = model.v_dot[self.loc_dof][:, :, np.newaxis]
+
+        il, ifl = self.list_loaded_elements, self.list_follower_loaded_elements
+        s_gps = 0.5 * (np.asarray(self.gps.xw[0]) + 1.)
+        loads = self.evaluate_distributed_loads(model, self.list_distributed_loads, s_gps)
+        follower_loads = self.evaluate_distributed_loads(model, self.list_distributed_follower_loads, s_gps)
+
+        Q = np.zeros((n_elem, 6, 12))
+        for i_gp, (s, w) in enumerate(zip(s_gps, self.gps.xw[1])):
+            T_star = s * np.matmul(FrameArray.get_tangent_operator(s * d), P[:, :, 6:])
+            Q[:, :, :6], Q[:, :, 6:] = np.eye(6) - T_star, T_star
+            QT = np.swapaxes(Q, 1, 2)
+            wL = (0.5 * w) * self.L
+
+            if len(il) or len(ifl):
+                distributed_load = np.zeros((n_elem, 6))
+
+            if len(il):
+                distributed_load[il, :3] = self.gravity_load[il]
+                for values, indices in loads:
+                    distributed_load[indices] += values[i_gp]
+                distributed_load[il] *= model.load_factor
+
+                H = HA[il] * FrameArray.get_frame_from_parameters(s * d[il])
+                RT = np.swapaxes(H.q.get_rotation_matrix(), 1, 2)
+                distributed_load[il, :3] = np.matmul(RT, distributed_load[il, :3, np.newaxis])[:, :, 0]
+                distributed_load[il, 3:] = np.matmul(RT, distributed_load[il, 3:, np.newaxis])[:, :, 0]
+                wL_load = wL[il, np.newaxis] * distributed_load[il]
+                dloadQ = np.concatenate((np.matmul(tilde_array(wL_load[:, :3]), Q[il, 3:, :]),
+                                         np.matmul(tilde_array(wL_load[:, 3:]), Q[il, 3:, :])), axis=1)
+                self.kt[il] -= np.matmul(QT[il], dloadQ)
+
+            if len(ifl):
+                for values, indices in follower_loads:
+                    distributed_load[indices] += model.load_factor * values[i_gp]
+
+            if len(il) or len(ifl):
+                self.res -= np.matmul(QT, (wL[:, np.newaxis] * distributed_load)[:, :, np.newaxis])[:, :, 0]
+
+            if model.analysis_type != TypeOfAnalysis.STATIC:
+                m_gp = self.M * wL[:, np.newaxis, np.newaxis]
+                v_gp = np.matmul(Q, v)
+                mv_gp = np.matmul(m_gp, v_gp)
+
+                vgp_tilde6T = np.swapaxes(tilde6_array(v_gp[:, :, 0]), 1, 2)
+                self.res -= np.matmul(QT, np.matmul(vgp_tilde6T, mv_gp))[:, :, 0]
+                self.ct -= np.matmul(QT, np.matmul(np.matmul(vgp_tilde6T, m_gp) + breve6_array(mv_gp[:, :, 0]), Q))
+
+                QTM = np.matmul(QT, m_gp)
+                self.res += np.matmul(QTM, np.matmul(Q, v_dot))[:, :, 0]
+                self.mt += np.matmul(QTM, Q)
+
+    def get_internal_forces(self, model):
+        return (np.matmul(self.K, (self.d - self.d0)[:, :, np.newaxis])[:, :, 0] / self.L[:, np.newaxis]).ravel()
+
+    def assemble_kt_impl(self, model):
+        F = np.matmul(self.K, (self.d - self.d0)[:, :, np.newaxis])[:, :, 0]
+        self.kt[:, :6, :] += np.matmul(FrameArray.get_derivative_inverse_transposed_tangent_operator(-self.d, F), self.P)
+        self.kt[:, 6:, :] += np.matmul(FrameArray.get_derivative_inverse_transposed_tangent_operator(self.d, F), self.P)
+
+        self.at = self.kt
+        return True
+
+    def assemble_ct_impl(self, model):
+        self.at = self.ct
+        return True
+
+    def assemble_mt_impl(self, model):
+        self.at = self.mt
+        return True
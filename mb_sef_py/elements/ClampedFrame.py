@@ -23,6 +23,10 @@ class ClampedFrame(ElementWithConstraints):
         self.bt = np.eye(6)
         self.inverse_frame_ref = None
 
+    @staticmethod
+    def get_constant_contributions():
+        return ('bt',)
+
     def get_number_of_dofs(self):
         return 6
 
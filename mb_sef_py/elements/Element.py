@@ -11,15 +11,32 @@ class Element(abc.ABC):
         self.elem_props = props
 
         self.list_nodes = [[] for _ in range(TypeOfVariables.Count)]
-        self.loc_dof = []
+        self.loc_dof = None
+        self.kinematics = None
+        self.kinematics_version = None
         self.res = None
+        self.ref = None
         self.at = None
         self.st = None
+        self.st_dofs = None
+        self.st_work = None
+        self.constant_st = None
+        self.constant_st_coefs = None
+        self.group = None
+        self.index_in_group = None
 
     @abc.abstractmethod
     def get_number_of_dofs(self):
         pass
 
+    @staticmethod
+    def get_constant_contributions():
+        return ()
+
+    @staticmethod
+    def get_element_group_type():
+        return None
+
     def get_size_res(self):
         return self.get_number_of_dofs()
 
@@ -29,38 +46,70 @@ class Element(abc.ABC):
     def mesh(self, model):
         pass
 
+    def shift_element_numbers(self, offset):
+        pass
+
     def build_loc_dof(self, model):
-        self.loc_dof = []
+        loc_dof = []
         for field in range(TypeOfVariables.Count):
             for node in self.list_nodes[field]:
                 i0 = model.dof_offsets[field] + node.get_first_index_dof()
-                for i in range(i0, i0+node.get_number_of_dofs()):
-                    self.loc_dof.append(i)
+                loc_dof.extend(range(i0, i0+node.get_number_of_dofs()))
+        self.loc_dof = np.array(loc_dof, dtype=int)
 
     def initialize(self, model):
         self.build_loc_dof(model)
         size_res = self.get_size_res()
         self.res = np.zeros((size_res,))
         self.st = np.zeros((size_res, size_res))
+        n_dof = self.get_number_of_dofs()
+        self.st_dofs = self.st[:n_dof, :n_dof]
+        self.st_work = np.zeros((n_dof, n_dof))
+        self.constant_st = None
+        self.constant_st_coefs = None
+
+    def get_kinematics(self, model):
+        if self.kinematics_version != model.kinematics_version:
+            self.kinematics = self.compute_kinematics(model)
+            self.kinematics_version = model.kinematics_version
+        return self.kinematics
+
+    def compute_kinematics(self, model):
+        return None
 
     def assemble_res(self, model, solver_params):
-        self.build_loc_dof(model)
         self.assemble_res_impl(model, solver_params)
-        return ResidueReturn(norm_forces=np.linalg.norm(self.res))
+        self.ref = ResidueReturn(norm_forces=np.linalg.norm(self.res))
+        return self.ref
 
     def assemble_res_impl(self, model, solver_params):
         pass
 
     def assemble_st(self, model,  coefs):
-        n_dof = self.get_number_of_dofs()
-        if coefs['coef_k'] != 0. and self.assemble_kt_impl(model):
-            self.st[np.ix_(range(n_dof), range(n_dof))] = coefs['coef_k'] * self.at
+        constant_contributions = self.get_constant_contributions()
+        if constant_contributions:
+            self.st_dofs[:] = self.get_constant_st(model, coefs)
         else:
-            self.st[np.ix_(range(n_dof), range(n_dof))] *= 0.
-        if coefs['coef_c'] != 0. and self.assemble_ct_impl(model):
-            self.st[np.ix_(range(n_dof), range(n_dof))] += coefs['coef_c'] * self.at
-        if coefs['coef_m'] != 0. and self.assemble_mt_impl(model):
-            self.st[np.ix_(range(n_dof), range(n_dof))] += coefs['coef_m'] * self.at
+            self.st_dofs[:] = 0.
+        for coef, contribution, assemble_impl in self.get_contributions(coefs):
+            if contribution not in constant_contributions and coef != 0. and assemble_impl(model):
+                np.multiply(coef, self.at, out=self.st_work)
+                self.st_dofs += self.st_work
+
+    def get_contributions(self, coefs):
+        return [(coefs['coef_k'], 'kt', self.assemble_kt_impl),
+                (coefs['coef_c'], 'ct', self.assemble_ct_impl),
+                (coefs['coef_m'], 'mt', self.assemble_mt_impl)]
+
+    def get_constant_st(self, model, coefs):
+        coefs_key = (coefs['coef_k'], coefs['coef_c'], coefs['coef_m'])
+        if coefs_key != self.constant_st_coefs:
+            self.constant_st = np.zeros(self.st_dofs.shape)
+            for coef, contribution, assemble_impl in self.get_contributions(coefs):
+                if contribution in self.get_constant_contributions() and coef != 0. and assemble_impl(model):
+                    self.constant_st += coef * self.at
+            self.constant_st_coefs = coefs_key
+        return self.constant_st
 
     def assemble_kt_impl(self, model):
         return False
@@ -71,15 +120,41 @@ class Element(abc.ABC):
     def assemble_mt_impl(self, model):
         return False
 
+    def has_mechanical_power(self):
+        return True
+
     def get_mechanical_power(self, model):
+        if model.v is None or not self.has_mechanical_power():
+            return 0.
         return np.dot(model.v[self.loc_dof], self.res)
 
+    def get_number_of_internal_forces(self):
+        return 0
+
+    def get_internal_forces(self, model):
+        return np.zeros((0,))
+
+    def reject_time_step(self, model):
+        pass
+
+    def reset_time(self, model):
+        pass
+
+    def get_state(self):
+        return {}
+
+    def set_state(self, state):
+        pass
+
 
 class ElementWithConstraints(Element):
     def __init__(self, props):
         Element.__init__(self, props)
         self.bt = None
         self.constraint = None
+        self.st_bt = None
+        self.st_btT = None
+        self.constant_bt_coef = None
 
     @staticmethod
     @abc.abstractmethod
@@ -95,30 +170,39 @@ class ElementWithConstraints(Element):
     def get_size_res(self):
         return self.get_number_of_dofs() + self.get_number_of_constraints()
 
-    def assemble_res(self, model, solver_params):
-        self.build_loc_dof(model)
+    def initialize(self, model):
+        Element.initialize(self, model)
+        n_dof = self.get_number_of_dofs()
+        self.st_bt = self.st[n_dof:, :n_dof]
+        self.st_btT = self.st[:n_dof, n_dof:]
+        self.constant_bt_coef = None
 
+    def assemble_res(self, model, solver_params):
         self.assemble_constraint_and_bt(model)
 
         lambd = self.list_nodes[TypeOfVariables.LAGRANGE_MULTIPLIER][0].lambd[model.current_configuration]
         self.res[:self.get_number_of_dofs()] = np.matmul(np.transpose(self.bt), lambd)
         self.res[-self.get_number_of_constraints():] = self.constraint
 
-        ref = ResidueReturn(norm_forces=np.linalg.norm(self.res[:self.get_number_of_dofs()]),
-                            norm_constraints=np.linalg.norm(self.res[-self.get_number_of_constraints():]))
+        self.ref = ResidueReturn(norm_forces=np.linalg.norm(self.res[:self.get_number_of_dofs()]),
+                                 norm_constraints=np.linalg.norm(self.res[-self.get_number_of_constraints():]))
         self.res[-self.get_number_of_constraints():] *= self.elem_props.constraint_scaling
-        return ref
+        return self.ref
 
     def assemble_st(self, model,  coefs):
         Element.assemble_st(self, model, coefs)
-        n_dof, n_cons = self.get_number_of_dofs(), self.get_number_of_constraints()
+        is_bt_constant = 'bt' in self.get_constant_contributions()
+        if is_bt_constant and coefs['coef_b'] == self.constant_bt_coef:
+            return
         if coefs['coef_b'] != 0. and self.assemble_bt_impl(model):
             sca_coef_b = self.elem_props.constraint_scaling * coefs['coef_b']
-            self.st[np.ix_(range(n_dof), range(n_dof, n_dof+n_cons))] = sca_coef_b * np.transpose(self.bt)
-            self.st[np.ix_(range(n_dof, n_dof+n_cons), range(n_dof))] = sca_coef_b * self.bt
+            np.multiply(sca_coef_b, self.bt, out=self.st_bt)
+            np.multiply(sca_coef_b, np.transpose(self.bt), out=self.st_btT)
         else:
-            self.st[np.ix_(range(n_dof), range(n_dof, n_dof+n_cons))] *= 0.
-            self.st[np.ix_(range(n_dof, n_dof+n_cons), range(n_dof))] *= 0.
+            self.st_bt[:] = 0.
+            self.st_btT[:] = 0.
+        if is_bt_constant:
+            self.constant_bt_coef = coefs['coef_b']
 
     @abc.abstractmethod
     def assemble_constraint_and_bt(self, model):
@@ -127,5 +211,5 @@ class ElementWithConstraints(Element):
     def assemble_bt_impl(self, model):
         return True
 
-    def get_mechanical_power(self, model):
-        return 0.
+    def has_mechanical_power(self):
+        return False
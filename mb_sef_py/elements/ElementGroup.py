@@ -0,0 +1,65 @@
+import abc
+import numpy as np
+
+from .ResidueReturn import ResidueReturn
+
+
+class ElementGroup(abc.ABC):
+    def __init__(self, list_elements):
+        self.list_elements = list_elements
+
+        self.loc_dof = None
+        self.res = None
+        self.norm_res = None
+        self.at = None
+        self.st = None
+
+    def get_number_of_elements(self):
+        return len(self.list_elements)
+
+    def get_number_of_dofs(self):
+        return self.list_elements[0].get_number_of_dofs()
+
+    def initialize(self, model):
+        for i, element in enumerate(self.list_elements):
+            element.group, element.index_in_group = self, i
+        n_elem, n_dof = self.get_number_of_elements(), self.get_number_of_dofs()
+        self.loc_dof = np.array([element.loc_dof for element in self.list_elements], dtype=int)
+        self.res = np.zeros((n_elem, n_dof))
+        self.st = np.zeros((n_elem, n_dof, n_dof))
+
+    def assemble_res(self, model, solver_params):
+        self.assemble_res_impl(model, solver_params)
+        self.norm_res = np.linalg.norm(self.res, axis=1)
+        return ResidueReturn(norm_forces=np.sum(self.norm_res))
+
+    @abc.abstractmethod
+    def assemble_res_impl(self, model, solver_params):
+        pass
+
+    def assemble_st(self, model, coefs):
+        if coefs['coef_k'] != 0. and self.assemble_kt_impl(model):
+            np.multiply(coefs['coef_k'], self.at, out=self.st)
+        else:
+            self.st[:] = 0.
+        if coefs['coef_c'] != 0. and self.assemble_ct_impl(model):
+            self.st += coefs['coef_c'] * self.at
+        if coefs['coef_m'] != 0. and self.assemble_mt_impl(model):
+            self.st += coefs['coef_m'] * self.at
+
+    def assemble_kt_impl(self, model):
+        return False
+
+    def assemble_ct_impl(self, model):
+        return False
+
+    def assemble_mt_impl(self, model):
+        return False
+
+    def get_mechanical_power(self, model):
+        if model.v is None:
+            return 0.
+        return np.einsum('ij,ij->', model.v[self.loc_dof], self.res)
+
+    def get_internal_forces(self, model):
+        return np.concatenate([element.get_internal_forces(model) for element in self.list_elements])
@@ -22,26 +22,29 @@ class ExternalForce(Element):
     def __init__(self, props, node):
         Element.__init__(self, props)
         self.add_node(node)
+        self.kt = np.zeros((6, 6))
 
     def get_number_of_dofs(self):
         return 6
 
     def assemble_res_impl(self, model, solver_params):
         if self.elem_props.time_dependent_force is not None:
-            self.elem_props.forces = self.elem_props.time_dependent_force(model.time)
+            self.elem_props.forces = model.evaluate_load(self.elem_props.time_dependent_force)
 
+        forces = model.load_factor * self.elem_props.forces
         if self.elem_props.follower:
-            self.res = - self.elem_props.forces[:]
+            self.res[:] = - forces
         else:
             nodal_frame = self.list_nodes[TypeOfVariables.MOTION][0].frame[model.current_configuration]
             RT = nodal_frame.q.get_inverse().get_rotation_matrix()
-            self.res[:3] = - np.matmul(RT, self.elem_props.forces[:3])
-            self.res[3:] = - np.matmul(RT, self.elem_props.forces[3:])
+            self.res[:3] = - np.matmul(RT, forces[:3])
+            self.res[3:] = - np.matmul(RT, forces[3:])
 
     def assemble_kt_impl(self, model):
         if self.elem_props.follower:
             return False
         else:
-            self.at = np.block([[np.zeros((3, 3)), tilde(self.res[:3])],
-                                [np.zeros((3, 3)), tilde(self.res[3:])]])
+            self.kt[:3, 3:] = tilde(self.res[:3])
+            self.kt[3:, 3:] = tilde(self.res[3:])
+            self.at = self.kt
             return True
@@ -11,6 +11,10 @@ class GroundJointElement(ElementWithConstraints):
         ElementWithConstraints.__init__(self, props)
         self.add_node(node)
 
+    @staticmethod
+    def get_constant_contributions():
+        return ('bt',)
+
     def get_number_of_dofs(self):
         return 6 + self.elem_props.get_number_of_relative_dof()
 
@@ -30,6 +34,8 @@ class GroundJointElement(ElementWithConstraints):
 
         self.bt = np.block([-np.eye(6), self.elem_props.A])
 
+        if model.v is None:
+            return
         ATA = np.matmul(np.transpose(self.elem_props.A), self.elem_props.A)
         node_rel_dof.v0 = np.linalg.solve(ATA, np.matmul(np.transpose(self.elem_props.A),
                                                          model.v[self.loc_dof[:6]]))
@@ -35,22 +35,27 @@ class KinematicJointElement(ElementWithConstraints):
         self.bt[:, 6:] = np.block([-np.eye(6), self.elem_props.A])
         self.bt[:, :6] = frame_ref.get_inverse_adjoint()
 
+        if model.v is None:
+            return
         ATA = np.matmul(np.transpose(self.elem_props.A), self.elem_props.A)
         node_rel_dof.v0 = - np.linalg.solve(ATA, np.matmul(np.transpose(self.elem_props.A),
                                                            np.matmul(self.bt[:, :12], model.v[self.loc_dof[:12]])))
         model.v[self.loc_dof[12:self.get_number_of_dofs()]] = node_rel_dof.v0
 
+    def compute_kinematics(self, model):
+        frame_I = self.list_nodes[TypeOfVariables.RELATIVE_MOTION][0].frame[model.current_configuration]
+        return frame_I, frame_I.get_inverse_adjoint()
+
     def assemble_constraint_and_bt(self, model):
         frame_A = self.list_nodes[TypeOfVariables.MOTION][0].frame[model.current_configuration]
         frame_B = self.list_nodes[TypeOfVariables.MOTION][1].frame[model.current_configuration]
-        frame_I = self.list_nodes[TypeOfVariables.RELATIVE_MOTION][0].frame[model.current_configuration]
+        frame_I, inverse_adjoint_I = self.get_kinematics(model)
 
-        self.bt[:, :6] = frame_I.get_inverse_adjoint()
+        self.bt[:, :6] = inverse_adjoint_I
         self.constraint = Frame.get_parameters_from_frame(frame_B.get_inverse() * frame_A * frame_I)
 
     def assemble_bt_impl(self, model):
-        frame_I = self.list_nodes[TypeOfVariables.RELATIVE_MOTION][0].frame[model.current_configuration]
-        self.bt[:, :6] = frame_I.get_inverse_adjoint()
+        self.bt[:, :6] = self.get_kinematics(model)[1]
         return True
 
     def assemble_kt_impl(self, model):
@@ -22,13 +22,18 @@ class RigidBodyElement(Element):
         Element.__init__(self, props)
         self.add_node(node)
         self.mt = np.block([[self.elem_props.m * np.eye(3), np.zeros((3, 3))], [np.zeros((3, 3)), self.elem_props.J]])
+        self.ct = np.zeros((6, 6))
+
+    @staticmethod
+    def get_constant_contributions():
+        return ('mt',)
 
     def get_number_of_dofs(self):
         return 6
 
     def assemble_res_impl(self, model, solver_params):
-        if model.analysis_type != TypeOfAnalysis.DYNAMIC:
-            self.res = np.zeros((6,))
+        if model.analysis_type == TypeOfAnalysis.STATIC:
+            self.res[:] = 0.
             return
 
         v_dot = model.v_dot[self.loc_dof]
@@ -44,10 +49,10 @@ class RigidBodyElement(Element):
         v = model.v[self.loc_dof]
         u, omega = v[:3], v[3:]
 
-        self.at = np.block([[tilde(self.elem_props.m * omega),
-                             tilde(- self.elem_props.m * u)],
-                            [np.zeros((3, 3)),
-                             np.matmul(tilde(omega), self.elem_props.J) - tilde(np.matmul(self.elem_props.J, omega))]])
+        self.ct[:3, :3] = tilde(self.elem_props.m * omega)
+        self.ct[:3, 3:] = tilde(- self.elem_props.m * u)
+        self.ct[3:, 3:] = np.matmul(tilde(omega), self.elem_props.J) - tilde(np.matmul(self.elem_props.J, omega))
+        self.at = self.ct
         return True
 
     def assemble_mt_impl(self, model):
@@ -24,6 +24,10 @@ class RigidLinkElement(ElementWithConstraints):
         self.frame_ref = None
         self.inverse_adjoint_frame_ref = None
 
+    @staticmethod
+    def get_constant_contributions():
+        return ('bt',)
+
     def get_number_of_dofs(self):
         return 12
 
@@ -4,6 +4,7 @@ from .Element import ElementWithConstraints
 from .ElementProperties import ElementWithConstraintsProperties
 from ..core.TypeOfVariables import TypeOfVariables
 from ..math.SE3 import Frame
+from ..math.SO3 import UnitQuaternion
 
 
 class ServoConstraintProperties(ElementWithConstraintsProperties):
@@ -24,6 +25,12 @@ class ServoConstraintElement(ElementWithConstraints):
         self.previous_time = None
         self.previous_frame = None
         self.current_frame = None
+        self.previous_imposed_displacement = None
+        self.state_before_update = None
+
+    @staticmethod
+    def get_constant_contributions():
+        return ('bt',)
 
     def get_number_of_dofs(self):
         return 1
@@ -32,6 +39,9 @@ class ServoConstraintElement(ElementWithConstraints):
     def get_number_of_constraints():
         return 1
 
+    def shift_element_numbers(self, offset):
+        self.element_number += offset
+
     def mesh(self, model):
         ElementWithConstraints.mesh(self, model)
         element = model.list_elements[self.element_number]
@@ -46,20 +56,52 @@ class ServoConstraintElement(ElementWithConstraints):
         self.previous_frame = node_rel_dof.frame_0
         self.current_frame = self.previous_frame
         self.previous_time = model.time
+        self.previous_imposed_displacement = self.elem_props.imposed_displacement(model.time)
 
     def assemble_constraint_and_bt(self, model):
         node_rel_dof = self.list_nodes[TypeOfVariables.RELATIVE_MOTION][0]
 
         if model.time > self.previous_time:
+            self.state_before_update = (self.previous_time, self.previous_frame, self.current_frame,
+                                        self.previous_imposed_displacement)
             self.previous_frame = self.current_frame
 
             imposed_displacement = self.elem_props.imposed_displacement(model.time)
+            increment = imposed_displacement
             if model.time > 0.:
-                imposed_displacement -= self.elem_props.imposed_displacement(self.previous_time)
-            imposed_frame = Frame.get_frame_from_parameters(node_rel_dof.A[:, 0] * imposed_displacement)
+                increment = imposed_displacement - self.previous_imposed_displacement
+            imposed_frame = Frame.get_frame_from_parameters(node_rel_dof.A[:, 0] * increment)
             self.current_frame = self.previous_frame * imposed_frame
 
             self.previous_time = model.time
+            self.previous_imposed_displacement = imposed_displacement
 
         relative_frame = self.current_frame.get_inverse() * node_rel_dof.frame[model.current_configuration]
         self.constraint = np.matmul(np.transpose(node_rel_dof.A), Frame.get_parameters_from_frame(relative_frame))
+
+    def reject_time_step(self, model):
+        if self.previous_time > model.time:
+            self.previous_time, self.previous_frame, self.current_frame, self.previous_imposed_displacement = \
+                self.state_before_update
+
+    def reset_time(self, model):
+        self.previous_frame = self.current_frame
+        self.previous_time = model.time
+        self.previous_imposed_displacement = self.elem_props.imposed_displacement(model.time)
+        self.state_before_update = None
+
+    def get_state(self):
+        return {
+            'previous_time': self.previous_time,
+            'previous_frame': np.block([self.previous_frame.x, self.previous_frame.q.e0, self.previous_frame.q.e]),
+            'current_frame': np.block([self.current_frame.x, self.current_frame.q.e0, self.current_frame.q.e]),
+            'previous_imposed_displacement': self.previous_imposed_displacement,
+        }
+
+    def set_state(self, state):
+        self.previous_time = float(state['previous_time'])
+        self.previous_frame, self.current_frame = [
+            Frame(x=np.copy(state[name][:3]), q=UnitQuaternion(e0=state[name][3], e=np.copy(state[name][4:])))
+            for name in ['previous_frame', 'current_frame']]
+        self.previous_imposed_displacement = state['previous_imposed_displacement']
+        self.state_before_update = None
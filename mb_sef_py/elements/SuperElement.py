@@ -0,0 +1,115 @@
+import numpy as np
+
+from .Element import Element
+from .ElementProperties import ElementProperties
+from ..core.NodeRn import NodeRelativeRn
+from ..core.TypeOfAnalysis import TypeOfAnalysis
+from ..core.TypeOfVariables import TypeOfVariables
+from ..math import Frame
+from ..math.SE3 import tilde6_array, breve6_array
+
+
+class SuperElementProperties(ElementProperties):
+    def __init__(self, K, M, number_of_modes, basis=None):
+        ElementProperties.__init__(self)
+        self.K = K
+        self.M = M
+        self.number_of_modes = number_of_modes
+        self.basis = basis
+        self.gyroscopic = True
+
+    @staticmethod
+    def get_element_type():
+        return SuperElement
+
+
+class SuperElement(Element):
+    def __init__(self, props, *boundary_nodes):
+        Element.__init__(self, props)
+        for node in boundary_nodes:
+            self.add_node(node)
+        self.number_of_boundary_nodes = len(boundary_nodes)
+
+        self.d0 = None
+        self.F = None
+        self.kt = None
+        self.ct = None
+
+    def get_number_of_dofs(self):
+        return 6 * self.number_of_boundary_nodes + self.elem_props.number_of_modes
+
+    @staticmethod
+    def get_constant_contributions():
+        return ('mt',)
+
+    def mesh(self, model):
+        Element.mesh(self, model)
+        if self.elem_props.number_of_modes > 0:
+            self.add_node(model.add_node(NodeRelativeRn, self.elem_props.number_of_modes))
+
+    def initialize(self, model):
+        Element.initialize(self, model)
+        HA = self.list_nodes[TypeOfVariables.MOTION][0].frame_ref
+        self.d0 = [Frame.get_parameters_from_frame(HA.get_inverse() * node.frame_ref)
+                   for node in self.list_nodes[TypeOfVariables.MOTION][1:]]
+        n_dof = self.get_number_of_dofs()
+        self.ct = np.zeros((n_dof, n_dof))
+
+    def compute_kinematics(self, model):
+        list_nodes = self.list_nodes[TypeOfVariables.MOTION]
+        HA = list_nodes[0].frame[model.current_configuration]
+        d = [Frame.get_parameters_from_frame(HA.get_inverse() * node.frame[model.current_configuration])
+             for node in list_nodes[1:]]
+
+        n_q = self.elem_props.K.shape[0]
+        q, P = np.zeros((n_q,)), np.zeros((n_q, self.get_number_of_dofs()))
+        for j, d_j in enumerate(d):
+            q[6*j:6*j+6] = d_j - self.d0[j]
+            P[6*j:6*j+6, :6] = -Frame.get_inverse_tangent_operator(-d_j)
+            P[6*j:6*j+6, 6*j+6:6*j+12] = Frame.get_inverse_tangent_operator(d_j)
+        if self.elem_props.number_of_modes > 0:
+            q[6*len(d):] = self.list_nodes[TypeOfVariables.RELATIVE_MOTION][0].x[model.current_configuration]
+            P[6*len(d):, 6*len(list_nodes):] = np.eye(self.elem_props.number_of_modes)
+        return d, q, P
+
+    def assemble_res_impl(self, model, solver_params):
+        _, q, P = self.get_kinematics(model)
+        self.F = np.matmul(self.elem_props.K, q)
+        self.res = np.matmul(np.transpose(P), self.F)
+        self.kt = np.matmul(np.transpose(P), np.matmul(self.elem_props.K, P))
+
+        if model.analysis_type != TypeOfAnalysis.STATIC:
+            v, v_dot = model.v[self.loc_dof], model.v_dot[self.loc_dof]
+            self.res += np.matmul(self.elem_props.M, v_dot)
+
+            if self.elem_props.gyroscopic:
+                n_boundary = 6 * self.number_of_boundary_nodes
+                mv = np.matmul(self.elem_props.M[:n_boundary, :], v).reshape((-1, 6))
+                v_tilde6T = np.transpose(tilde6_array(v[:n_boundary].reshape((-1, 6))), (0, 2, 1))
+                self.res[:n_boundary] -= np.einsum('kij,kj->ki', v_tilde6T, mv).ravel()
+
+                self.ct[:n_boundary, :] = - np.matmul(
+                    v_tilde6T, self.elem_props.M[:n_boundary, :].reshape((-1, 6, len(v)))).reshape((n_boundary, -1))
+                mv_breve6 = breve6_array(mv)
+                for i in range(self.number_of_boundary_nodes):
+                    self.ct[6*i:6*i+6, 6*i:6*i+6] -= mv_breve6[i]
+
+    def assemble_kt_impl(self, model):
+        d, _, P = self.get_kinematics(model)
+        for j, d_j in enumerate(d):
+            F_j = self.F[6*j:6*j+6]
+            self.kt[:6, :] += np.matmul(Frame.get_derivative_inverse_transposed_tangent_operator(-d_j, F_j),
+                                        P[6*j:6*j+6, :])
+            self.kt[6*j+6:6*j+12, :] += np.matmul(Frame.get_derivative_inverse_transposed_tangent_operator(d_j, F_j),
+                                                  P[6*j:6*j+6, :])
+
+        self.at = self.kt
+        return True
+
+    def assemble_ct_impl(self, model):
+        self.at = self.ct
+        return self.elem_props.gyroscopic
+
+    def assemble_mt_impl(self, model):
+        self.at = self.elem_props.M
+        return True
@@ -8,3 +8,4 @@ from .KinematicJointElement import KinematicJointElement
 from .RigidBodyElement import RigidBodyProperties
 from .RigidLinkElement import RigidLinkProperties
 from .ServoConstraintElement import ServoConstraintProperties
+from .SuperElement import SuperElementProperties
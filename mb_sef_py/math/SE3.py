@@ -1,5 +1,5 @@
 import numpy as np
-from .SO3 import UnitQuaternion, tilde
+from .SO3 import UnitQuaternion, QuaternionArray, tilde, tilde_array
 
 
 def tilde6(x):
@@ -16,6 +16,20 @@ def breve6(x):
     return x_breve6
 
 
+def tilde6_array(x):
+    x_tilde6 = np.zeros(x.shape[:-1] + (6, 6))
+    x_tilde6[..., :3, :3] = x_tilde6[..., 3:, 3:] = tilde_array(x[..., 3:])
+    x_tilde6[..., :3, 3:] = tilde_array(x[..., :3])
+    return x_tilde6
+
+
+def breve6_array(x):
+    x_breve6 = np.zeros(x.shape[:-1] + (6, 6))
+    x_breve6[..., :3, 3:] = x_breve6[..., 3:, :3] = tilde_array(x[..., :3])
+    x_breve6[..., 3:, 3:] = tilde_array(x[..., 3:])
+    return x_breve6
+
+
 class Frame:
     def __init__(self, x=np.zeros((3,)), q=UnitQuaternion(), ref_frame=None):
         if ref_frame is None:
@@ -95,3 +109,137 @@ class Frame:
         DTinvT2 = np.matmul(-0.25 * rho * 0.25/(p0*p0*p0) * du, np.transpose(pw)) - np.matmul(0.25/p0 * du, np.transpose(pu))
 
         return np.block([[np.zeros((3, 3)), DTinvT0u], [DTinvT0u, DTinvT0r+DTinvT2]])
+
+
+def _p0_array(parameters):
+    return np.sqrt(1. - 0.25 * np.einsum('...i,...i->...', parameters[..., 3:], parameters[..., 3:]))
+
+
+def _rho_array(parameters):
+    return np.einsum('...i,...i->...', parameters[..., :3], parameters[..., 3:])
+
+
+class FrameArray:
+    def __init__(self, n=0, x=None, q=None):
+        self.x = np.zeros((n, 3)) if x is None else x
+        self.q = QuaternionArray(n) if q is None else q
+
+    def __len__(self):
+        return self.x.shape[0]
+
+    def __getitem__(self, item):
+        return FrameArray(x=self.x[item], q=self.q[item])
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    @staticmethod
+    def from_frames(list_frames):
+        return FrameArray(x=np.array([frame.x for frame in list_frames]).reshape((-1, 3)),
+                          q=QuaternionArray.from_unit_quaternions([frame.q for frame in list_frames]))
+
+    def get_frame(self, i):
+        return Frame(x=np.copy(self.x[i]), q=self.q.get_unit_quaternion(i))
+
+    def multiply(self, other, out=None):
+        x = self.x + self.q.rotate_vector(other.x)
+        if out is None:
+            out = FrameArray(x=x, q=self.q.multiply(other.q))
+        else:
+            self.q.multiply(other.q, out=out.q)
+            out.x[...] = x
+        return out
+
+    def get_inverse(self, out=None):
+        if out is None:
+            out = FrameArray(x=np.empty(self.x.shape), q=QuaternionArray(q=np.empty(self.q.q.shape)))
+        x = -self.x
+        self.q.get_inverse(out=out.q)
+        out.q.rotate_vector(x, out=out.x)
+        return out
+
+    def get_adjoint(self, out=None):
+        if out is None:
+            out = np.zeros(self.x.shape[:-1] + (6, 6))
+        R = self.q.get_rotation_matrix()
+        out[..., :3, :3] = out[..., 3:, 3:] = R
+        out[..., :3, 3:] = np.matmul(R, tilde_array(self.x))
+        out[..., 3:, :3] = 0.
+        return out
+
+    def get_inverse_adjoint(self, out=None):
+        if out is None:
+            out = np.zeros(self.x.shape[:-1] + (6, 6))
+        RT = np.swapaxes(self.q.get_rotation_matrix(), -1, -2)
+        out[..., :3, :3] = out[..., 3:, 3:] = RT
+        out[..., :3, 3:] = np.matmul(tilde_array(-self.x), RT)
+        out[..., 3:, :3] = 0.
+        return out
+
+    @staticmethod
+    def get_frame_from_parameters(parameters, out=None):
+        if out is None:
+            out = FrameArray(x=np.empty(parameters.shape[:-1] + (3,)),
+                             q=QuaternionArray(q=np.empty(parameters.shape[:-1] + (4,))))
+        QuaternionArray.get_unitquat_from_parameters(parameters[..., 3:], out=out.q)
+        h = out.q.q[..., 1:]
+        h_x_pu = np.cross(h, parameters[..., :3])
+        x = parameters[..., :3] + np.cross(h, h_x_pu)
+        x /= out.q.q[..., :1]
+        np.add(x, h_x_pu, out=out.x)
+        return out
+
+    @staticmethod
+    def get_parameters_from_frame(frame, out=None):
+        if out is None:
+            out = np.empty(frame.x.shape[:-1] + (6,))
+        p_u = frame.q.q[..., :1] * frame.x - np.cross(frame.q.q[..., 1:], frame.x)
+        np.multiply(2., frame.q.q[..., 1:], out=out[..., 3:])
+        out[..., :3] = p_u
+        return out
+
+    @staticmethod
+    def get_tangent_operator(parameters, out=None):
+        if out is None:
+            out = np.empty(parameters.shape[:-1] + (6, 6))
+        p0 = _p0_array(parameters)[..., np.newaxis, np.newaxis]
+        p_tilde = tilde_array(0.5 * parameters[..., 3:])
+        tmp = np.eye(3) + np.matmul(p_tilde, p_tilde)
+        rho = _rho_array(parameters)[..., np.newaxis, np.newaxis]
+        p_u_tilde = tilde_array(0.5 * parameters[..., :3])
+        out[..., :3, :3] = out[..., 3:, 3:] = 1. / p0 * tmp - p_tilde
+        out[..., :3, 3:] = rho / (4. * p0 ** 3) * tmp - p_u_tilde + \
+            1. / (4. * p0) * (np.matmul(p_tilde, p_u_tilde) + np.matmul(p_u_tilde, p_tilde))
+        out[..., 3:, :3] = 0.
+        return out
+
+    @staticmethod
+    def get_inverse_tangent_operator(parameters, out=None):
+        if out is None:
+            out = np.empty(parameters.shape[:-1] + (6, 6))
+        p0 = _p0_array(parameters)[..., np.newaxis, np.newaxis]
+        rho = _rho_array(parameters)[..., np.newaxis, np.newaxis]
+        out[..., :3, :3] = out[..., 3:, 3:] = p0 * np.eye(3) + tilde_array(0.5 * parameters[..., 3:])
+        out[..., :3, 3:] = -rho / (4. * p0) * np.eye(3) + tilde_array(0.5 * parameters[..., :3])
+        out[..., 3:, :3] = 0.
+        return out
+
+    @staticmethod
+    def get_derivative_inverse_transposed_tangent_operator(parameters, direction, out=None):
+        if out is None:
+            out = np.empty(parameters.shape[:-1] + (6, 6))
+        pu, pw = parameters[..., :3], parameters[..., 3:]
+        du, dw = direction[..., :3], direction[..., 3:]
+
+        p0 = _p0_array(parameters)[..., np.newaxis, np.newaxis]
+        rho = _rho_array(parameters)[..., np.newaxis, np.newaxis]
+
+        du_pwT = du[..., :, np.newaxis] * pw[..., np.newaxis, :]
+        DTinvT0u = tilde_array(0.5 * du) - (0.25/p0) * du_pwT
+        DTinvT0r = tilde_array(0.5 * dw) - (0.25/p0) * dw[..., :, np.newaxis] * pw[..., np.newaxis, :]
+        DTinvT2 = (-0.25 * rho * 0.25/(p0*p0*p0)) * du_pwT - (0.25/p0) * du[..., :, np.newaxis] * pu[..., np.newaxis, :]
+
+        out[..., :3, :3] = 0.
+        out[..., :3, 3:] = out[..., 3:, :3] = DTinvT0u
+        out[..., 3:, 3:] = DTinvT0r + DTinvT2
+        return out
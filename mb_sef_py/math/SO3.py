@@ -113,3 +113,108 @@ class UnitQuaternion:
     @staticmethod
     def get_parameters_from_unitquat(unitquat):
         return 2. * unitquat.e[:]
+
+
+class UnitQuaternionView(UnitQuaternion):
+    def __init__(self, q):
+        self.q = q
+
+    @property
+    def e0(self):
+        return self.q[0]
+
+    @e0.setter
+    def e0(self, e0):
+        self.q[0] = e0
+
+    @property
+    def e(self):
+        return self.q[1:]
+
+    @e.setter
+    def e(self, e):
+        self.q[1:] = e
+
+
+def tilde_array(x):
+    x_tilde = np.zeros(x.shape[:-1] + (3, 3))
+    x_tilde[..., 0, 1] = -x[..., 2]
+    x_tilde[..., 0, 2] = x[..., 1]
+    x_tilde[..., 1, 0] = x[..., 2]
+    x_tilde[..., 1, 2] = -x[..., 0]
+    x_tilde[..., 2, 0] = -x[..., 1]
+    x_tilde[..., 2, 1] = x[..., 0]
+    return x_tilde
+
+
+class QuaternionArray:
+    def __init__(self, n=0, q=None):
+        if q is None:
+            self.q = np.zeros((n, 4))
+            self.q[:, 0] = 1.
+        else:
+            self.q = q
+
+    @property
+    def e0(self):
+        return self.q[..., 0]
+
+    @property
+    def e(self):
+        return self.q[..., 1:]
+
+    def __len__(self):
+        return self.q.shape[0]
+
+    def __getitem__(self, item):
+        return QuaternionArray(q=self.q[item])
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    @staticmethod
+    def from_unit_quaternions(list_unit_quaternions):
+        return QuaternionArray(q=np.array([(q.e0, *q.e) for q in list_unit_quaternions]).reshape((-1, 4)))
+
+    def get_unit_quaternion(self, i):
+        return UnitQuaternion(e0=self.q[i, 0], e=np.copy(self.q[i, 1:]))
+
+    def multiply(self, other, out=None):
+        p, q = self.q, other.q
+        e0 = p[..., 0] * q[..., 0] - np.einsum('...i,...i->...', p[..., 1:], q[..., 1:])
+        e = p[..., :1] * q[..., 1:] + q[..., :1] * p[..., 1:] + np.cross(p[..., 1:], q[..., 1:])
+        if out is None:
+            out = QuaternionArray(q=np.empty(np.broadcast_shapes(p.shape, q.shape)))
+        out.q[..., 0], out.q[..., 1:] = e0, e
+        return out
+
+    def get_inverse(self, out=None):
+        if out is None:
+            out = QuaternionArray(q=np.empty(self.q.shape))
+        out.q[..., 0] = self.q[..., 0]
+        np.negative(self.q[..., 1:], out=out.q[..., 1:])
+        return out
+
+    def rotate_vector(self, vec, out=None):
+        e_x_vec = np.cross(self.q[..., 1:], vec)
+        rotated_vec = self.q[..., :1] * e_x_vec + np.cross(self.q[..., 1:], e_x_vec)
+        rotated_vec *= 2.
+        return np.add(vec, rotated_vec, out=out)
+
+    def get_rotation_matrix(self, out=None):
+        e_tilde = tilde_array(self.q[..., 1:])
+        R = self.q[..., 0, np.newaxis, np.newaxis] * e_tilde + np.matmul(e_tilde, e_tilde)
+        R *= 2.
+        return np.add(np.eye(3), R, out=out)
+
+    @staticmethod
+    def get_unitquat_from_parameters(parameters, out=None):
+        if out is None:
+            out = QuaternionArray(q=np.empty(parameters.shape[:-1] + (4,)))
+        out.q[..., 0] = np.sqrt(1. - 0.25 * np.einsum('...i,...i->...', parameters, parameters))
+        np.multiply(0.5, parameters, out=out.q[..., 1:])
+        return out
+
+    @staticmethod
+    def get_parameters_from_unitquat(unitquat, out=None):
+        return np.multiply(2., unitquat.q[..., 1:], out=out)
@@ -1,2 +1,2 @@
-from .SO3 import UnitQuaternion
-from .SE3 import Frame
+from .SO3 import UnitQuaternion, QuaternionArray
+from .SE3 import Frame, FrameArray
@@ -0,0 +1,209 @@
+import contextlib
+import os
+import time
+import traceback
+
+import numpy as np
+
+from ..core.Model import Model
+from ..core.TypeOfVariables import TypeOfVariables
+from ..utils.ParameterSweep import ParameterSweep
+
+
+class EnsembleLogger:
+    def __init__(self, ensemble, list_loggers):
+        self.ensemble = ensemble
+        self.list_loggers = list_loggers
+
+        self.model = None
+
+    def initialize(self, model, solver):
+        self.model = model
+        for _, logger in self.list_loggers:
+            logger.initialize(model, solver)
+
+    def get_state(self):
+        state = {}
+        for variant, logger in self.list_loggers:
+            for name, value in logger.get_state().items():
+                state['variant_' + str(variant) + '/' + name] = value
+        return state
+
+    def restart(self, model, solver, state):
+        self.model = model
+        for variant, logger in self.list_loggers:
+            prefix = 'variant_' + str(variant) + '/'
+            logger.restart(model, solver, {name[len(prefix):]: value for name, value in state.items()
+                                           if name.startswith(prefix)})
+
+    def log_step(self, step_number):
+        if all(step_number % logger.periodicity != 0 for _, logger in self.list_loggers):
+            return
+
+        mechanical_power = self.model.mechanical_power
+        variant_mechanical_power = self.ensemble.get_mechanical_power()
+        for variant, logger in self.list_loggers:
+            self.model.mechanical_power = variant_mechanical_power[variant]
+            logger.log_step(step_number)
+        self.model.mechanical_power = mechanical_power
+
+    def finalize(self):
+        for _, logger in self.list_loggers:
+            logger.finalize()
+
+
+class Ensemble(ParameterSweep):
+    def __init__(self, solver_factory, parameter_grid, name='ensemble', quiet=True):
+        ParameterSweep.__init__(self, solver_factory, parameter_grid, name=name, max_workers=1, quiet=quiet)
+
+        self.list_solvers = None
+        self.model = None
+        self.solver = None
+
+        self.list_variant_nodes = None
+        self.element_variants = None
+        self.variant_dofs = None
+        self.variant_motion_dofs = None
+        self.group_variants = None
+
+    def build(self):
+        self.list_solvers = [self.solver_factory(self.get_case_name(i), **parameters)
+                             for i, parameters in enumerate(self.list_parameters)]
+        first_solver = self.list_solvers[0]
+        if any(vars(solver.tip) != vars(first_solver.tip) for solver in self.list_solvers[1:]):
+            raise ValueError('Ensemble variants must share the same time integration parameters')
+
+        self.model = Model()
+        self.model.use_element_groups = first_solver.model.use_element_groups
+        self.model.dof_ordering = first_solver.model.dof_ordering
+
+        self.list_variant_nodes, self.element_variants = [], {}
+        for variant, solver in enumerate(self.list_solvers):
+            self.add_variant(variant, solver.model)
+        self.model.mesh()
+        self.build_variant_dofs()
+
+        list_loggers = [(variant, solver.logger) for variant, solver in enumerate(self.list_solvers) if solver.logger]
+        self.solver = type(first_solver)(self.model, first_solver.tip,
+                                         EnsembleLogger(self, list_loggers) if list_loggers else None,
+                                         first_solver.profiler)
+        self.solver.convergence_criterion = self.is_converged
+        return self.solver
+
+    def add_variant(self, variant, model):
+        if model.is_meshed:
+            raise ValueError('Ensemble variants must be built on models that are not meshed yet')
+
+        element_offset = len(self.model.list_elements)
+        for field in range(TypeOfVariables.Count):
+            self.model.list_nodes[field].extend(model.list_nodes[field])
+        for element in model.list_elements:
+            element.shift_element_numbers(element_offset)
+            self.model.list_elements.append(element)
+            self.element_variants[id(element)] = variant
+        self.list_variant_nodes.append([node for field in range(TypeOfVariables.Count)
+                                        for node in model.list_nodes[field]])
+
+    def build_variant_dofs(self):
+        list_variant_dofs = [[] for _ in range(self.get_number_of_cases())]
+        for variant, list_nodes in enumerate(self.list_variant_nodes):
+            list_variant_dofs[variant].extend(list_nodes)
+        for element in self.model.list_elements:
+            list_variant_dofs[self.element_variants[id(element)]].extend(
+                [node for field in range(TypeOfVariables.Count) for node in element.list_nodes[field]])
+
+        for variant, list_nodes in enumerate(list_variant_dofs):
+            dofs = [np.arange(self.model.dof_offsets[node.get_field()] + node.get_first_index_dof(),
+                              self.model.dof_offsets[node.get_field()] + node.get_first_index_dof() +
+                              node.get_number_of_dofs()) for node in list_nodes]
+            list_variant_dofs[variant] = np.unique(np.concatenate(dofs)) if dofs else np.zeros((0,), dtype=int)
+
+        if len(set(len(dofs) for dofs in list_variant_dofs)) > 1:
+            raise ValueError('Ensemble variants must share the same topology')
+        self.variant_dofs = np.array(list_variant_dofs, dtype=int)
+        n_motion = self.model.get_number_of_motion_dofs()
+        self.variant_motion_dofs = self.variant_dofs[:, :np.count_nonzero(self.variant_dofs[0] < n_motion)]
+        self.group_variants = None
+
+    def get_variant_dofs(self):
+        return self.variant_dofs
+
+    def get_variant_motion_dofs(self):
+        return self.variant_motion_dofs
+
+    def get_group_variants(self):
+        if self.group_variants is None:
+            self.group_variants = [np.array([self.element_variants[id(element)] for element in group.list_elements])
+                                   for group in self.model.list_element_groups]
+        return self.group_variants
+
+    def get_reference_norms(self):
+        model = self.model
+        norm_forces = np.zeros((self.get_number_of_cases(),))
+        norm_constraints = np.zeros((self.get_number_of_cases(),))
+        for element in model.list_single_elements:
+            variant = self.element_variants[id(element)]
+            norm_forces[variant] += element.ref.norm_forces
+            norm_constraints[variant] += element.ref.norm_constraints
+        for group, variants in zip(model.list_element_groups, self.get_group_variants()):
+            np.add.at(norm_forces, variants, group.norm_res)
+        return norm_forces, norm_constraints
+
+    def is_converged(self, tip):
+        res = self.model.res
+        n_motion = self.variant_motion_dofs.shape[1]
+        ref_forces, ref_constraints = self.get_reference_norms()
+        norm_res_forces = np.linalg.norm(res[self.variant_motion_dofs], axis=1)
+        norm_res_constraints = np.linalg.norm(res[self.variant_dofs[:, n_motion:]], axis=1)
+        return bool(np.all(norm_res_forces <= tip.tol_res_forces * (1. + ref_forces)) and
+                    np.all(norm_res_constraints <= tip.tol_res_constraints * (1. + ref_constraints)))
+
+    def get_velocities(self):
+        return self.model.v[self.variant_motion_dofs]
+
+    def get_accelerations(self):
+        return self.model.v_dot[self.variant_motion_dofs]
+
+    def get_mechanical_power(self):
+        model = self.model
+        mechanical_power = np.zeros((self.get_number_of_cases(),))
+        if model.v is None:
+            return mechanical_power
+        for element in model.list_single_elements:
+            mechanical_power[self.element_variants[id(element)]] += element.get_mechanical_power(model)
+        for group, variants in zip(model.list_element_groups, self.get_group_variants()):
+            np.add.at(mechanical_power, variants, np.einsum('ij,ij->i', model.v[group.loc_dof], group.res))
+        return mechanical_power
+
+    def run(self):
+        n_cases = self.get_number_of_cases()
+        self.list_summaries = [{
+            'case_name': self.get_case_name(i),
+            'parameters': self.list_parameters[i],
+            'error': None,
+        } for i in range(n_cases)]
+
+        t0 = time.perf_counter()
+        try:
+            with open(os.devnull, 'w') as devnull, \
+                    contextlib.redirect_stdout(devnull) if self.quiet else contextlib.nullcontext():
+                self.build()
+                self.solver.solve()
+            for summary, solver in zip(self.list_summaries, self.list_solvers):
+                summary.update({
+                    'number_of_steps': self.solver.number_of_steps,
+                    'mean_number_of_iterations': self.solver.mean_number_of_iterations,
+                    'max_number_of_iterations': self.solver.max_number_of_iterations,
+                    'number_of_factorizations': self.solver.linear_solver.number_of_factorizations,
+                    'output_file': solver.logger.file_name + '.h5' if solver.logger else None,
+                })
+        except Exception:
+            error = traceback.format_exc()
+            for summary in self.list_summaries:
+                summary['error'] = error
+        wall_time = time.perf_counter() - t0
+        for summary in self.list_summaries:
+            summary['wall_time'] = wall_time / n_cases
+
+        self.print_summaries()
+        return self.list_summaries
@@ -1,18 +1,57 @@
+import time
 import numpy as np
-from scipy.sparse.linalg import spsolve
 
+from .LinearSolver import build_linear_solver
 from .SolverParameters import TimeIntegrationParameters
+from .SolverObserver import IterationReport, StepReport
+from .TypeOfVerbosity import TypeOfVerbosity
 from ..core.TypeOfVariables import TypeOfVariables
 from ..core.Model import TypeOfAnalysis, dict_of_assembly_coefs
+from ..utils.Checkpoint import write_checkpoint, read_checkpoint
+from ..utils.Profiler import Profiler
 
 
 class GeneralizedAlpha:
-    def __init__(self, model, tip=TimeIntegrationParameters(), logger=None):
+    def __init__(self, model, tip=TimeIntegrationParameters(), logger=None, profiler=None):
         self.model = model
         self.tip = tip
         self.logger = logger
+        self.profiler = Profiler(enabled=False) if profiler is None else profiler
+        self.linear_solver = None
+
+        self.h = None
+        self.gap = None
+        self.assembly_coefs = None
+        self.a_n = None
+        self.iterations_with_jacobian = 0
 
         self.number_of_iterations = None
+        self.converged = False
+        self.norm_res_forces = 0.
+        self.norm_res_constraints = 0.
+        self.ref = None
+        self.error_ratio = 0.
+        self.number_of_steps = 0
+        self.number_of_rejected_steps = 0
+        self.mean_number_of_iterations = 0.
+        self.max_number_of_iterations = 0.
+
+        self.list_observers = []
+        self.last_checkpoint_time = None
+        self.convergence_criterion = None
+
+    def add_observer(self, observer):
+        self.list_observers.append(observer)
+
+    def notify_step(self, accepted):
+        if not self.list_observers:
+            return
+        step = self.number_of_steps if accepted else self.number_of_steps + 1
+        report = StepReport(self.model.time, step, self.h, self.number_of_iterations, self.converged,
+                            accepted, self.norm_res_forces, self.norm_res_constraints, self.ref.norm_forces,
+                            self.ref.norm_constraints, self.error_ratio)
+        for observer in self.list_observers:
+            observer.step(self, report)
 
     @staticmethod
     def parameters(rho_inf, h):
@@ -28,84 +67,283 @@ class GeneralizedAlpha:
         })
         return parameters
 
-    def solve(self):
-        self.model.initialize(TypeOfAnalysis.DYNAMIC)
+    def set_step_size(self, h):
+        if h == self.h:
+            return
+        self.h = h
+        self.gap = GeneralizedAlpha.parameters(self.tip.rho, h)
+        self.assembly_coefs['coef_k'] = self.assembly_coefs['coef_b'] = 1.
+        self.assembly_coefs['coef_c'] = self.gap['gamma_p']
+        self.assembly_coefs['coef_m'] = self.gap['beta_p']
+        self.linear_solver.reset()
 
-        if self.logger:
-            self.logger.initialize(self.model, self)
-
-        assembly_coefs = dict_of_assembly_coefs()
-
-        # Initial acceleration
+    def solve_initial_acceleration(self):
         n_motion = self.model.get_number_of_motion_dofs()
-        assembly_coefs['coef_k'] = assembly_coefs['coef_c'] = 0.
-        assembly_coefs['coef_m'] = assembly_coefs['coef_b'] = 1.
-        self.model.assemble_res_st(assembly_coefs, self.tip)
-        st = self.model.build_iteration_matrix_from_sparse_representation()
-        corr = - spsolve(st, self.model.res)
+        self.assembly_coefs = dict_of_assembly_coefs()
+        self.assembly_coefs['coef_k'] = self.assembly_coefs['coef_c'] = 0.
+        self.assembly_coefs['coef_m'] = self.assembly_coefs['coef_b'] = 1.
+        self.model.assemble_res_st(self.assembly_coefs, self.tip)
+        self.linear_solver.factorize(self.model.build_iteration_matrix_from_sparse_representation())
+        corr = - self.linear_solver.solve(self.model.res)
         self.model.v_dot = corr[:n_motion]
-        a_n = corr[:n_motion]
+        self.a_n = np.copy(corr[:n_motion])
         self.model.inc[n_motion:] = corr[n_motion:]
         self.model.kinematic_update([TypeOfVariables.LAGRANGE_MULTIPLIER])
-        #
 
-        if self.logger:
-            self.logger.log_step(0)
+    def solve_time_step(self):
+        h, gap, n_motion = self.h, self.gap, self.model.get_number_of_motion_dofs()
+        profiler = self.profiler
+        self.model.advance_time_step(h)
+        if self.tip.verbosity >= TypeOfVerbosity.STEPS:
+            print('time: ', self.model.time, '; step: ', self.number_of_steps)
 
-        gap = GeneralizedAlpha.parameters(self.tip.rho, self.tip.h)
-        number_of_steps = int(self.tip.T / self.tip.h)
-        mean_number_of_iterations = 0.
-        max_number_of_iterations = 0.
-        assembly_coefs['coef_k'] = assembly_coefs['coef_b'] = 1.
-        assembly_coefs['coef_c'] = gap['gamma_p']
-        assembly_coefs['coef_m'] = gap['beta_p']
-
-        for step in range(number_of_steps):
-            self.model.advance_time_step(self.tip.h)
-            print('time: ', self.model.time, '; step: ', step)
-
-            self.model.inc[:n_motion] = self.tip.h * self.model.v[:] + \
-                                        (0.5 - gap['beta']) * self.tip.h * self.tip.h * a_n[:]
-            self.model.v += self.tip.h * (1. - gap['gamma']) * a_n[:]
-            a_n = (gap['alpha_f'] * self.model.v_dot[:] - gap['alpha_m'] * a_n[:]) / (1. - gap['alpha_m'])
-            self.model.inc[:n_motion] += gap['beta'] * self.tip.h * self.tip.h * a_n[:]
-            self.model.v += gap['gamma'] * self.tip.h * a_n[:]
+        with profiler.timer('prediction'):
+            self.model.inc[:n_motion] = h * self.model.v[:] + (0.5 - gap['beta']) * h * h * self.a_n[:]
+            self.model.v += h * (1. - gap['gamma']) * self.a_n[:]
+            a_n = (gap['alpha_f'] * self.model.v_dot[:] - gap['alpha_m'] * self.a_n[:]) / (1. - gap['alpha_m'])
+            self.model.inc[:n_motion] += gap['beta'] * h * h * a_n[:]
+            self.model.v += gap['gamma'] * h * a_n[:]
 
             self.model.v_dot *= 0.
             self.model.inc[n_motion:] *= 0.
+        with profiler.timer('kinematic_update'):
             self.model.kinematic_update()
 
-            self.number_of_iterations = 0
-            while self.number_of_iterations < self.tip.nit_max:
-                ref = self.model.assemble_res_st(assembly_coefs, self.tip)
+        self.number_of_iterations = 0
+        self.converged = False
+        refactorize = not self.linear_solver.is_factorized()
+        previous_norm_res = None
+        while self.number_of_iterations < self.tip.nit_max:
+            with profiler.timer('assembly'):
+                self.ref = ref = self.model.assemble_res(self.tip)
 
-                norm_res_forces = np.linalg.norm(self.model.res[:n_motion])
-                norm_res_cons = np.linalg.norm(self.model.res[n_motion:])
+            self.norm_res_forces = norm_res_forces = np.linalg.norm(self.model.res[:n_motion])
+            self.norm_res_constraints = norm_res_cons = np.linalg.norm(self.model.res[n_motion:])
+            if self.tip.verbosity >= TypeOfVerbosity.ITERATIONS:
                 print('nit: ', self.number_of_iterations,
                       '; nres_f: ', norm_res_forces, ' / ', ref.norm_forces,
                       '; nres_c: ', norm_res_cons, ' / ', ref.norm_constraints)
+            if self.list_observers:
+                report = IterationReport(self.model.time, self.number_of_steps + 1, self.number_of_iterations,
+                                         norm_res_forces, norm_res_cons, ref.norm_forces, ref.norm_constraints)
+                for observer in self.list_observers:
+                    observer.iteration(self, report)
+
+            if self.is_converged(ref):
+                self.converged = True
+                profiler.set_counter('norm_res_forces', norm_res_forces)
+                profiler.set_counter('norm_res_constraints', norm_res_cons)
+                break
 
-                if norm_res_forces <= self.tip.tol_res_forces * (1. + ref.norm_forces) and \
-                   norm_res_cons <= self.tip.tol_res_constraints * (1. + ref.norm_constraints):
-                    break
+            norm_res = np.linalg.norm(self.model.res)
+            if not self.tip.modified_newton or self.iterations_with_jacobian >= self.tip.nit_max_jacobian_reuse or \
+               (previous_norm_res is not None and norm_res > self.tip.max_contraction_rate * previous_norm_res):
+                refactorize = True
+            previous_norm_res = norm_res
 
-                st = self.model.build_iteration_matrix_from_sparse_representation()
-                corr = spsolve(st, self.model.res)
+            if refactorize:
+                with profiler.timer('assembly'):
+                    self.model.assemble_st(self.assembly_coefs)
+                with profiler.timer('matrix_build'):
+                    iteration_matrix = self.model.build_iteration_matrix_from_sparse_representation()
+                with profiler.timer('factorization'):
+                    self.linear_solver.factorize(iteration_matrix)
+                refactorize = False
+                self.iterations_with_jacobian = 0
+            with profiler.timer('linear_solve'):
+                corr = self.linear_solver.solve(self.model.res)
+            self.iterations_with_jacobian += 1
+            with profiler.timer('correction'):
                 self.model.inc -= corr[:]
                 self.model.v -= gap['gamma_p'] * corr[:n_motion]
                 self.model.v_dot -= gap['beta_p'] * corr[:n_motion]
+            with profiler.timer('kinematic_update'):
                 self.model.kinematic_update()
 
-                self.number_of_iterations += 1
+            self.number_of_iterations += 1
+
+        if self.number_of_iterations == self.tip.nit_max:
+            self.linear_solver.reset()
+        profiler.set_counter('number_of_iterations', self.number_of_iterations)
+        profiler.set_counter('number_of_nonzeros', self.model.st_pattern.get_number_of_nonzeros())
+        a_n += (1. - gap['alpha_f'])/(1. - gap['alpha_m']) * self.model.v_dot[:]
+        return a_n
+
+    def is_converged(self, ref):
+        if self.convergence_criterion is not None:
+            return self.convergence_criterion(self.tip)
+        return self.norm_res_forces <= self.tip.tol_res_forces * (1. + ref.norm_forces) and \
+            self.norm_res_constraints <= self.tip.tol_res_constraints * (1. + ref.norm_constraints)
+
+    def estimate_local_error(self, previous_v_dot):
+        error = self.h * self.h * abs(self.gap['beta'] - 1./6.) * \
+            np.linalg.norm(self.model.v_dot - previous_v_dot, ord=np.inf)
+        return error / self.tip.tol_local_error
+
+    def get_next_step_size(self):
+        if not self.converged:
+            factor = self.tip.h_decrease_factor
+        else:
+            factor = self.tip.h_safety_factor * max(self.error_ratio, 1.e-10) ** (-1./3.)
+            if self.number_of_iterations > self.tip.nit_target:
+                factor = min(factor, (1. * self.tip.nit_target) / self.number_of_iterations)
+            factor = min(max(factor, self.tip.h_decrease_factor), self.tip.h_increase_factor)
+        h_max = self.tip.T if self.tip.h_max is None else self.tip.h_max
+        return min(max(factor * self.h, self.tip.h_min), h_max)
+
+    def get_step_size_to_end(self, h):
+        remaining = self.tip.T - self.model.time
+        if remaining <= 1.1 * h:
+            h = remaining
+        elif remaining < 2. * h:
+            h = 0.5 * remaining
+        return max(h, self.tip.h_min)
+
+    def get_expected_number_of_steps(self):
+        if self.tip.adaptive:
+            return None
+        return int(self.tip.T / self.tip.h)
+
+    def is_finished(self, number_of_steps):
+        if self.tip.adaptive:
+            return self.model.time >= self.tip.T * (1. - 1.e-12)
+        return self.number_of_steps >= number_of_steps
+
+    def get_state(self):
+        state = self.model.get_state()
+        state.update({
+            'solver/a_n': np.copy(self.a_n),
+            'solver/h': self.h,
+            'solver/number_of_steps': self.number_of_steps,
+            'solver/number_of_rejected_steps': self.number_of_rejected_steps,
+            'solver/mean_number_of_iterations': self.mean_number_of_iterations,
+            'solver/max_number_of_iterations': self.max_number_of_iterations,
+        })
+        if self.logger:
+            for name, value in self.logger.get_state().items():
+                state['logger/' + name] = value
+        return state
+
+    def set_state(self, state):
+        self.model.set_state(state)
+        self.a_n = np.copy(state['solver/a_n'])
+        self.h = None
+        self.set_step_size(float(state['solver/h']))
+        self.number_of_steps = int(state['solver/number_of_steps'])
+        self.number_of_rejected_steps = int(state['solver/number_of_rejected_steps'])
+        self.mean_number_of_iterations = float(state['solver/mean_number_of_iterations'])
+        self.max_number_of_iterations = float(state['solver/max_number_of_iterations'])
+
+    def write_checkpoint(self, file_name):
+        with self.profiler.timer('checkpoint'):
+            write_checkpoint(file_name, self.get_state())
+        self.last_checkpoint_time = time.perf_counter()
+
+    def is_checkpoint_due(self):
+        if self.tip.checkpoint_file_name is None:
+            return False
+        if self.tip.checkpoint_periodicity is not None and self.number_of_steps % self.tip.checkpoint_periodicity == 0:
+            return True
+        return self.tip.checkpoint_wall_time is not None and \
+            time.perf_counter() - self.last_checkpoint_time >= self.tip.checkpoint_wall_time
+
+    def initialize_from_checkpoint(self, file_name):
+        state = read_checkpoint(file_name)
+        self.assembly_coefs = dict_of_assembly_coefs()
+        self.linear_solver = build_linear_solver(self.tip, self.model.dof_permutation)
+        self.set_state(state)
+        if self.logger:
+            self.logger.restart(self.model, self, {name[len('logger/'):]: value for name, value in state.items()
+                                                   if name.startswith('logger/')})
+        for observer in self.list_observers:
+            observer.initialize(self)
+
+    def initialize_from_initial_conditions(self):
+        if self.logger:
+            self.logger.initialize(self.model, self)
+        for observer in self.list_observers:
+            observer.initialize(self)
+
+        self.linear_solver = build_linear_solver(self.tip, self.model.dof_permutation)
+        self.solve_initial_acceleration()
+
+        if self.logger:
+            self.logger.log_step(0)
+        self.profiler.end_step()
+
+        self.h = None
+        self.set_step_size(self.tip.h)
+        self.number_of_steps = 0
+        self.number_of_rejected_steps = 0
+        self.mean_number_of_iterations = 0.
+        self.max_number_of_iterations = 0.
 
-            a_n += (1. - gap['alpha_f'])/(1. - gap['alpha_m']) * self.model.v_dot[:]
+    def solve(self, restart_file_name=None):
+        self.model.profiler = self.profiler
+        self.model.initialize(TypeOfAnalysis.DYNAMIC)
+
+        if restart_file_name is None:
+            self.initialize_from_initial_conditions()
+        else:
+            self.initialize_from_checkpoint(restart_file_name)
 
-            max_number_of_iterations = max(max_number_of_iterations, self.number_of_iterations)
-            mean_number_of_iterations += self.number_of_iterations
+        self.iterations_with_jacobian = 0
+        self.last_checkpoint_time = time.perf_counter()
+        number_of_steps = int(self.tip.T / self.tip.h)
+        h_min_used, h_max_used = self.h, self.h
+
+        while not self.is_finished(number_of_steps):
+            if self.tip.adaptive:
+                self.set_step_size(self.get_step_size_to_end(self.h))
+                saved_v, saved_v_dot = np.copy(self.model.v), np.copy(self.model.v_dot)
+
+            with self.profiler.timer('step'):
+                a_n = self.solve_time_step()
+
+            if self.tip.adaptive:
+                self.error_ratio = self.estimate_local_error(saved_v_dot) if self.converged else np.inf
+                next_h = self.get_next_step_size()
+                if self.error_ratio > 1.:
+                    if self.h <= self.tip.h_min:
+                        raise RuntimeError('Time step rejected at the minimal step size h_min = ' +
+                                           str(self.tip.h_min) + ' at time ' + str(self.model.time))
+                    self.notify_step(False)
+                    self.model.v, self.model.v_dot = saved_v, saved_v_dot
+                    self.model.reject_time_step()
+                    self.number_of_rejected_steps += 1
+                    self.set_step_size(next_h)
+                    self.profiler.set_counter('rejected', 1)
+                    self.profiler.end_step()
+                    continue
+                h_min_used, h_max_used = min(h_min_used, self.h), max(h_max_used, self.h)
+
+            self.a_n = a_n
+            self.number_of_steps += 1
+            self.max_number_of_iterations = max(self.max_number_of_iterations, self.number_of_iterations)
+            self.mean_number_of_iterations += self.number_of_iterations
             if self.logger:
-                self.logger.log_step(step+1)
+                with self.profiler.timer('logging'):
+                    self.logger.log_step(self.number_of_steps)
+            self.profiler.set_counter('step_size', self.h)
+            self.profiler.end_step()
+            self.notify_step(True)
+
+            if self.tip.adaptive:
+                self.set_step_size(next_h)
+            if self.is_checkpoint_due():
+                self.write_checkpoint(self.tip.checkpoint_file_name)
 
         if self.logger:
             self.logger.finalize()
-        mean_number_of_iterations = mean_number_of_iterations / number_of_steps
-        print('mean nit: ', mean_number_of_iterations, '; max nit: ', max_number_of_iterations)
+        for observer in self.list_observers:
+            observer.finalize(self)
+        self.mean_number_of_iterations /= max(self.number_of_steps, 1)
+        if self.tip.verbosity >= TypeOfVerbosity.SUMMARY:
+            print('mean nit: ', self.mean_number_of_iterations, '; max nit: ', self.max_number_of_iterations,
+                  '; number of factorizations: ', self.linear_solver.number_of_factorizations)
+            if self.tip.adaptive:
+                print('accepted steps: ', self.number_of_steps, '; rejected steps: ', self.number_of_rejected_steps,
+                      '; min h: ', h_min_used, '; max h: ', h_max_used)
+            print('linear solver: ', self.linear_solver.get_statistics())
+            if self.profiler.enabled:
+                self.profiler.print_summary()
@@ -0,0 +1,231 @@
+import abc
+import inspect
+import time
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu, spilu, gmres, minres, norm, LinearOperator
+
+from .TypeOfLinearSolver import TypeOfLinearSolver
+
+_krylov_tol_keyword = 'rtol' if 'rtol' in inspect.signature(gmres).parameters else 'tol'
+
+
+class LinearSolver(abc.ABC):
+    def __init__(self, permutation=None):
+        self.permutation = permutation
+        self.permuted_matrix = None
+        self.permuted_data_map = None
+
+        self.number_of_factorizations = 0
+        self.number_of_solves = 0
+        self.number_of_linear_iterations = 0
+        self.factorization_time = 0.
+        self.solve_time = 0.
+
+    @abc.abstractmethod
+    def reset(self):
+        pass
+
+    @abc.abstractmethod
+    def is_factorized(self):
+        pass
+
+    def permute_matrix(self, matrix):
+        if self.permuted_matrix is None or self.permuted_matrix.shape != matrix.shape or \
+                len(self.permuted_data_map) != len(matrix.data):
+            positions = matrix.copy()
+            positions.data = np.arange(1, len(matrix.data) + 1, dtype=float)
+            positions = positions[self.permutation, :][:, self.permutation].tocsc()
+            positions.sort_indices()
+            self.permuted_data_map = positions.data.astype(np.int64) - 1
+            self.permuted_matrix = positions
+        self.permuted_matrix.data = matrix.data[self.permuted_data_map]
+        return self.permuted_matrix
+
+    def factorize(self, matrix):
+        t0 = time.perf_counter()
+        if self.permutation is not None:
+            matrix = self.permute_matrix(matrix)
+        self.factorize_impl(matrix)
+        self.factorization_time += time.perf_counter() - t0
+        self.number_of_factorizations += 1
+
+    @abc.abstractmethod
+    def factorize_impl(self, matrix):
+        pass
+
+    def solve(self, rhs):
+        t0 = time.perf_counter()
+        if self.permutation is None:
+            sol = self.solve_impl(rhs)
+        else:
+            sol = np.empty_like(rhs)
+            sol[self.permutation] = self.solve_impl(rhs[self.permutation])
+        self.solve_time += time.perf_counter() - t0
+        self.number_of_solves += 1
+        return sol
+
+    @abc.abstractmethod
+    def solve_impl(self, rhs):
+        pass
+
+    def get_statistics(self):
+        return {
+            'number_of_factorizations': self.number_of_factorizations,
+            'number_of_solves': self.number_of_solves,
+            'number_of_linear_iterations': self.number_of_linear_iterations,
+            'factorization_time': self.factorization_time,
+            'solve_time': self.solve_time,
+        }
+
+
+class SparseLUSolver(LinearSolver):
+    def __init__(self, permc_spec='COLAMD', reuse_ordering=True, permutation=None):
+        LinearSolver.__init__(self, permutation)
+        self.permc_spec = permc_spec
+        self.reuse_ordering = reuse_ordering
+
+        self.perm_c = None
+        self.lu = None
+        self.is_permuted = False
+
+    def reset(self):
+        self.lu = None
+
+    def is_factorized(self):
+        return self.lu is not None
+
+    def factorize_impl(self, matrix):
+        if self.perm_c is None or matrix.shape[1] != len(self.perm_c):
+            self.lu = splu(matrix, permc_spec=self.permc_spec)
+            self.perm_c = np.argsort(self.lu.perm_c) if self.reuse_ordering else None
+            self.is_permuted = False
+        else:
+            self.lu = splu(matrix[:, self.perm_c], permc_spec='NATURAL')
+            self.is_permuted = True
+
+    def solve_impl(self, rhs):
+        if not self.is_permuted:
+            return self.lu.solve(rhs)
+        sol = np.empty_like(rhs)
+        sol[self.perm_c] = self.lu.solve(rhs)
+        return sol
+
+
+class DenseLUSolver(LinearSolver):
+    def __init__(self, permutation=None):
+        LinearSolver.__init__(self, permutation)
+        self.lu_piv = None
+
+    def reset(self):
+        self.lu_piv = None
+
+    def is_factorized(self):
+        return self.lu_piv is not None
+
+    def factorize_impl(self, matrix):
+        self.lu_piv = lu_factor(matrix.toarray(), overwrite_a=True, check_finite=False)
+
+    def solve_impl(self, rhs):
+        return lu_solve(self.lu_piv, rhs, check_finite=False)
+
+
+class KrylovSolver(LinearSolver):
+    def __init__(self, method=TypeOfLinearSolver.GMRES, tol=1.e-8, maxiter=500, restart=50,
+                 drop_tol=1.e-8, fill_factor=10., permutation=None):
+        LinearSolver.__init__(self, permutation)
+        self.method = method
+        self.tol = tol
+        self.maxiter = maxiter
+        self.restart = restart
+        self.drop_tol = drop_tol
+        self.fill_factor = fill_factor
+
+        self.current_drop_tol = drop_tol
+        self.matrix = None
+        self.matrix_norm = None
+        self.preconditioner = None
+        self.last_number_of_iterations = 0
+        self.last_info = 0
+
+    def reset(self):
+        self.matrix = None
+        self.preconditioner = None
+
+    def is_factorized(self):
+        return self.matrix is not None
+
+    def factorize_impl(self, matrix):
+        self.matrix = matrix.copy()
+        self.matrix_norm = norm(self.matrix, np.inf)
+        self.current_drop_tol = self.drop_tol
+        if self.method == TypeOfLinearSolver.GMRES:
+            self.preconditioner = self.build_incomplete_lu()
+        else:
+            if not self.is_symmetric():
+                raise ValueError('MINRES requires a symmetric iteration matrix, use GMRES instead')
+            self.preconditioner = None
+
+    def is_symmetric(self):
+        asymmetry = self.matrix - self.matrix.transpose()
+        scale = abs(self.matrix).max() if self.matrix.nnz > 0 else 0.
+        return asymmetry.nnz == 0 or abs(asymmetry).max() <= 1.e-12 * scale
+
+    def tighten_drop_tol(self):
+        if self.current_drop_tol == 0.:
+            return False
+        self.current_drop_tol = self.current_drop_tol * 1.e-2 if self.current_drop_tol > 1.e-14 else 0.
+        return True
+
+    def build_incomplete_lu(self):
+        while True:
+            try:
+                return spilu(self.matrix, drop_tol=self.current_drop_tol, fill_factor=self.fill_factor)
+            except RuntimeError:
+                if not self.tighten_drop_tol():
+                    raise
+
+    def is_converged(self, sol, rhs):
+        residual = np.linalg.norm(self.matrix @ sol - rhs, np.inf)
+        return residual <= self.tol * (self.matrix_norm * np.linalg.norm(sol, np.inf) + np.linalg.norm(rhs, np.inf))
+
+    def solve_impl(self, rhs):
+        self.last_number_of_iterations = 0
+
+        def count_iterations(_):
+            self.last_number_of_iterations += 1
+
+        kwargs = {_krylov_tol_keyword: self.tol, 'maxiter': self.maxiter, 'callback': count_iterations}
+        if self.method == TypeOfLinearSolver.MINRES:
+            sol, self.last_info = minres(self.matrix, rhs, **kwargs)
+            converged = self.is_converged(sol, rhs)
+        else:
+            while True:
+                preconditioned_matrix = LinearOperator(self.matrix.shape,
+                                                       lambda x: self.preconditioner.solve(self.matrix @ x))
+                sol, self.last_info = gmres(preconditioned_matrix, self.preconditioner.solve(rhs),
+                                            restart=self.restart, callback_type='pr_norm', **kwargs)
+                converged = self.is_converged(sol, rhs)
+                if converged or not self.tighten_drop_tol():
+                    break
+                self.preconditioner = self.build_incomplete_lu()
+        self.number_of_linear_iterations += self.last_number_of_iterations
+        if not converged:
+            raise RuntimeError('Krylov solver did not converge after ' + str(self.last_number_of_iterations) +
+                               ' iterations (info = ' + str(self.last_info) + ')')
+        return sol
+
+
+def build_linear_solver(solver_parameters, permutation=None):
+    if solver_parameters.linear_solver == TypeOfLinearSolver.SPARSE_LU:
+        permc_spec = solver_parameters.permc_spec if permutation is None else 'NATURAL'
+        return SparseLUSolver(permc_spec=permc_spec, permutation=permutation)
+    elif solver_parameters.linear_solver == TypeOfLinearSolver.DENSE_LU:
+        return DenseLUSolver(permutation=permutation)
+    elif solver_parameters.linear_solver in [TypeOfLinearSolver.GMRES, TypeOfLinearSolver.MINRES]:
+        return KrylovSolver(method=solver_parameters.linear_solver, tol=solver_parameters.krylov_tol,
+                            maxiter=solver_parameters.krylov_maxiter, restart=solver_parameters.krylov_restart,
+                            drop_tol=solver_parameters.ilu_drop_tol, fill_factor=solver_parameters.ilu_fill_factor,
+                            permutation=permutation)
+    else:
+        raise ValueError('Unknown linear solver type: ' + str(solver_parameters.linear_solver))
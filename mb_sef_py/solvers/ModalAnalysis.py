@@ -0,0 +1,126 @@
+import numpy as np
+import scipy.sparse
+from scipy.linalg import null_space
+from scipy.sparse.linalg import eigs, eigsh, splu
+
+from .SolverParameters import SolverParameters
+from ..core.Model import TypeOfAnalysis, dict_of_assembly_coefs
+from ..core.TypeOfVariables import TypeOfVariables
+from ..elements.SuperElement import SuperElementProperties
+from ..math import Frame
+
+
+class ModalAnalysis:
+    def __init__(self, model, number_of_modes=10, shift=0., gyroscopic=False, sp=SolverParameters()):
+        self.model = model
+        self.number_of_modes = number_of_modes
+        self.shift = shift
+        self.gyroscopic = gyroscopic
+        self.sp = sp
+
+        self.K = None
+        self.C = None
+        self.M = None
+        self.B = None
+        self.null_space_basis = None
+
+        self.eigenvalues = None
+        self.frequencies = None
+        self.modes = None
+
+    def assemble_matrix(self, coef_name):
+        coefs = dict_of_assembly_coefs()
+        coefs[coef_name] = 1.
+        self.model.assemble_st(coefs)
+        return self.model.build_iteration_matrix_from_sparse_representation().copy()
+
+    def linearize(self):
+        model = self.model
+        if not model.is_core_initialized:
+            model.initialize(TypeOfAnalysis.MODAL_REDUCTION)
+        elif model.v is None:
+            n_fm = model.number_of_dofs[TypeOfVariables.MOTION] + model.number_of_dofs[TypeOfVariables.RELATIVE_MOTION]
+            model.analysis_type = TypeOfAnalysis.MODAL_REDUCTION
+            model.v, model.v_dot = np.zeros((n_fm,)), np.zeros((n_fm,))
+
+        n_motion = model.get_number_of_motion_dofs()
+        model.assemble_res(self.sp)
+        self.K = self.assemble_matrix('coef_k')[:n_motion, :n_motion]
+        self.C = self.assemble_matrix('coef_c')[:n_motion, :n_motion]
+        self.M = self.assemble_matrix('coef_m')[:n_motion, :n_motion]
+        self.B = self.assemble_matrix('coef_b')[n_motion:, :n_motion]
+        return self.K, self.C, self.M, self.B
+
+    def build_null_space_basis(self):
+        n_motion = self.model.get_number_of_motion_dofs()
+        if self.B.shape[0] == 0:
+            self.null_space_basis = scipy.sparse.identity(n_motion, format='csc')
+        else:
+            self.null_space_basis = null_space(self.B.toarray())
+        return self.null_space_basis
+
+    def solve(self):
+        self.linearize()
+        N = self.build_null_space_basis()
+        K = N.T @ (0.5 * (self.K + self.K.T)) @ N
+        M = N.T @ (0.5 * (self.M + self.M.T)) @ N
+        number_of_modes = min(self.number_of_modes, K.shape[0] - 1)
+
+        if not self.gyroscopic:
+            eigenvalues, modes = eigsh(K, number_of_modes, M, sigma=self.shift, which='LM')
+            order = np.argsort(eigenvalues)
+            self.eigenvalues, modes = eigenvalues[order], modes[:, order]
+            self.frequencies = np.sqrt(np.maximum(self.eigenvalues, 0.)) / (2. * np.pi)
+        else:
+            C = N.T @ self.C @ N
+            n = K.shape[0]
+            A = scipy.sparse.bmat([[None, scipy.sparse.identity(n)], [-K, -C]], format='csc')
+            E = scipy.sparse.bmat([[scipy.sparse.identity(n), None], [None, M]], format='csc')
+            eigenvalues, modes = eigs(A, min(2 * number_of_modes, 2 * n - 2), E, sigma=self.shift)
+            selection = eigenvalues.imag >= 0.
+            eigenvalues, modes = eigenvalues[selection], modes[:n, selection]
+            order = np.argsort(np.abs(eigenvalues))[:number_of_modes]
+            self.eigenvalues, modes = eigenvalues[order], modes[:, order]
+            self.frequencies = np.abs(self.eigenvalues.imag) / (2. * np.pi)
+
+        self.modes = N @ modes
+        return self.frequencies, self.modes
+
+
+def craig_bampton_reduction(model, boundary_nodes, number_of_modes, shift=0.):
+    modal_analysis = ModalAnalysis(model)
+    modal_analysis.linearize()
+    if model.get_number_of_lagrange_multipliers() > 0 or model.number_of_dofs[TypeOfVariables.RELATIVE_MOTION] > 0:
+        raise ValueError('Craig-Bampton reduction expects a substructure without constraints')
+    if any(node.get_number_of_dofs() != 6 for node in model.list_nodes[TypeOfVariables.MOTION]):
+        raise ValueError('Craig-Bampton reduction expects a substructure made of nodal frames')
+
+    K = (0.5 * (modal_analysis.K + modal_analysis.K.T)).tocsc()
+    M = (0.5 * (modal_analysis.M + modal_analysis.M.T)).tocsc()
+    n = K.shape[0]
+
+    boundary_dofs = np.concatenate([np.arange(node.get_first_index_dof(), node.get_first_index_dof() + 6)
+                                    for node in boundary_nodes])
+    interior_dofs = np.setdiff1d(np.arange(n), boundary_dofs)
+    nb = len(boundary_dofs)
+    K_ii, K_ib = K[interior_dofs, :][:, interior_dofs], K[interior_dofs, :][:, boundary_dofs]
+    M_ii = M[interior_dofs, :][:, interior_dofs]
+
+    basis = np.zeros((n, nb + number_of_modes))
+    basis[boundary_dofs, :nb] = np.eye(nb)
+    basis[interior_dofs, :nb] = - splu(K_ii.tocsc()).solve(K_ib.toarray())
+    if number_of_modes > 0:
+        eigenvalues, modes = eigsh(K_ii, number_of_modes, M_ii, sigma=shift, which='LM')
+        basis[interior_dofs, nb:] = modes[:, np.argsort(eigenvalues)]
+
+    K_cb = basis.T @ (K @ basis)
+    M_cb = basis.T @ (M @ basis)
+
+    HA = boundary_nodes[0].frame_ref
+    transformation = np.eye(nb - 6 + number_of_modes)
+    for j, node in enumerate(boundary_nodes[1:]):
+        d0 = Frame.get_parameters_from_frame(HA.get_inverse() * node.frame_ref)
+        transformation[6*j:6*j+6, 6*j:6*j+6] = Frame.get_tangent_operator(d0)
+    K_q = transformation.T @ K_cb[6:, 6:] @ transformation
+
+    return SuperElementProperties(K_q, M_cb, number_of_modes, basis)
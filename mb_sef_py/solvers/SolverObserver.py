@@ -0,0 +1,64 @@
+import abc
+import numpy as np
+
+
+class IterationReport:
+    def __init__(self, time, step, iteration, norm_res_forces, norm_res_constraints,
+                 ref_norm_forces, ref_norm_constraints):
+        self.time = time
+        self.step = step
+        self.iteration = iteration
+        self.norm_res_forces = norm_res_forces
+        self.norm_res_constraints = norm_res_constraints
+        self.ref_norm_forces = ref_norm_forces
+        self.ref_norm_constraints = ref_norm_constraints
+
+
+class StepReport:
+    def __init__(self, time, step, h, number_of_iterations, converged, accepted, norm_res_forces,
+                 norm_res_constraints, ref_norm_forces, ref_norm_constraints, error_ratio=0.):
+        self.time = time
+        self.step = step
+        self.h = h
+        self.number_of_iterations = number_of_iterations
+        self.converged = converged
+        self.accepted = accepted
+        self.norm_res_forces = norm_res_forces
+        self.norm_res_constraints = norm_res_constraints
+        self.ref_norm_forces = ref_norm_forces
+        self.ref_norm_constraints = ref_norm_constraints
+        self.error_ratio = error_ratio
+
+
+class SolverObserver(abc.ABC):
+    def initialize(self, solver):
+        pass
+
+    def iteration(self, solver, report):
+        pass
+
+    def step(self, solver, report):
+        pass
+
+    def finalize(self, solver):
+        pass
+
+
+class ConvergenceHistory(SolverObserver):
+    fields = ['time', 'step', 'h', 'number_of_iterations', 'converged', 'accepted', 'norm_res_forces',
+              'norm_res_constraints', 'ref_norm_forces', 'ref_norm_constraints', 'error_ratio']
+
+    def __init__(self, accepted_steps_only=False):
+        self.accepted_steps_only = accepted_steps_only
+        self.history = None
+
+    def initialize(self, solver):
+        self.history = {field: [] for field in self.fields}
+
+    def step(self, solver, report):
+        if report.accepted or not self.accepted_steps_only:
+            for field in self.fields:
+                self.history[field].append(getattr(report, field))
+
+    def get(self, field):
+        return np.array(self.history[field])
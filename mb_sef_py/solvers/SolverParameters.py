@@ -1,3 +1,7 @@
+from .TypeOfLinearSolver import TypeOfLinearSolver
+from .TypeOfVerbosity import TypeOfVerbosity
+
+
 class SolverParameters:
     def __init__(self):
         self.h = 1.e-2
@@ -5,9 +9,50 @@ class SolverParameters:
         self.nit_max = 10
         self.tol_res_forces = 1.e-6
         self.tol_res_constraints = 1.e-6
+        self.verbosity = TypeOfVerbosity.ITERATIONS
+
+        self.modified_newton = False
+        self.nit_max_jacobian_reuse = 5
+        self.max_contraction_rate = 0.5
+
+        self.linear_solver = TypeOfLinearSolver.SPARSE_LU
+        self.permc_spec = 'COLAMD'
+        self.krylov_tol = 1.e-8
+        self.krylov_maxiter = 500
+        self.krylov_restart = 50
+        self.ilu_drop_tol = 1.e-8
+        self.ilu_fill_factor = 10.
+
+
+class StaticParameters(SolverParameters):
+    def __init__(self):
+        SolverParameters.__init__(self)
+        self.proportional_loading = True
+
+        self.arc_length = False
+        self.arc_length_increment = None
+        self.arc_length_increment_min = 1.e-8
+        self.arc_length_increment_max = None
+        self.arc_length_psi = 0.
+        self.load_factor_max = 1.
+        self.max_number_of_steps = 1000
+        self.nit_target = 4
 
 
 class TimeIntegrationParameters(SolverParameters):
     def __init__(self):
         SolverParameters.__init__(self)
         self.rho = 1.
+
+        self.adaptive = False
+        self.tol_local_error = 1.e-5
+        self.h_min = 1.e-8
+        self.h_max = None
+        self.nit_target = 4
+        self.h_safety_factor = 0.9
+        self.h_decrease_factor = 0.5
+        self.h_increase_factor = 2.
+
+        self.checkpoint_file_name = None
+        self.checkpoint_periodicity = None
+        self.checkpoint_wall_time = None
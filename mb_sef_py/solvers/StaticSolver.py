@@ -0,0 +1,255 @@
+import numpy as np
+
+from .LinearSolver import build_linear_solver
+from .SolverParameters import StaticParameters
+from .TypeOfVerbosity import TypeOfVerbosity
+from ..core.Model import TypeOfAnalysis, dict_of_assembly_coefs
+from ..utils.Profiler import Profiler
+
+
+class StaticSolver:
+    def __init__(self, model, sp=StaticParameters(), logger=None, profiler=None):
+        self.model = model
+        self.sp = sp
+        self.logger = logger
+        self.profiler = Profiler(enabled=False) if profiler is None else profiler
+        self.linear_solver = None
+
+        self.assembly_coefs = dict_of_assembly_coefs()
+        self.assembly_coefs['coef_k'] = self.assembly_coefs['coef_b'] = 1.
+        self.iterations_with_jacobian = 0
+
+        self.number_of_iterations = None
+        self.converged = False
+        self.number_of_steps = 0
+        self.number_of_rejected_steps = 0
+        self.mean_number_of_iterations = 0.
+        self.max_number_of_iterations = 0.
+
+        self.arc_length_increment = None
+        self.load_increment = None
+        self.previous_increment = None
+
+    def get_expected_number_of_steps(self):
+        if self.sp.arc_length:
+            return None
+        return int(self.sp.T / self.sp.h)
+
+    def assemble_load_vector(self):
+        res = np.copy(self.model.res)
+        self.model.load_factor += 1.
+        self.model.assemble_res(self.sp)
+        load_vector = self.model.res - res
+        self.model.load_factor -= 1.
+        self.model.res[:] = res
+        return load_vector
+
+    def refresh_jacobian(self):
+        with self.profiler.timer('assembly'):
+            self.model.assemble_st(self.assembly_coefs)
+        with self.profiler.timer('factorization'):
+            self.linear_solver.factorize(self.model.build_iteration_matrix_from_sparse_representation())
+        self.iterations_with_jacobian = 0
+
+    def is_converged(self, ref):
+        n_motion = self.model.get_number_of_motion_dofs()
+        norm_res_forces = np.linalg.norm(self.model.res[:n_motion])
+        norm_res_cons = np.linalg.norm(self.model.res[n_motion:])
+        if self.sp.verbosity >= TypeOfVerbosity.ITERATIONS:
+            print('nit: ', self.number_of_iterations,
+                  '; nres_f: ', norm_res_forces, ' / ', ref.norm_forces,
+                  '; nres_c: ', norm_res_cons, ' / ', ref.norm_constraints)
+        return norm_res_forces <= self.sp.tol_res_forces * (1. + ref.norm_forces) and \
+            norm_res_cons <= self.sp.tol_res_constraints * (1. + ref.norm_constraints)
+
+    def needs_new_jacobian(self, norm_res, previous_norm_res):
+        return not self.linear_solver.is_factorized() or not self.sp.modified_newton or \
+            self.iterations_with_jacobian >= self.sp.nit_max_jacobian_reuse or \
+            (previous_norm_res is not None and norm_res > self.sp.max_contraction_rate * previous_norm_res)
+
+    def solve_load_step(self, load_factor, time):
+        self.model.advance_time_step(time - self.model.time)
+        self.model.load_factor = load_factor
+        if self.sp.verbosity >= TypeOfVerbosity.STEPS:
+            print('time: ', self.model.time, '; load factor: ', load_factor, '; step: ', self.number_of_steps)
+
+        self.model.inc[:] = 0.
+        self.model.kinematic_update()
+
+        self.number_of_iterations = 0
+        self.converged = False
+        previous_norm_res = None
+        while self.number_of_iterations < self.sp.nit_max:
+            with self.profiler.timer('assembly'):
+                ref = self.model.assemble_res(self.sp)
+            if self.is_converged(ref):
+                self.converged = True
+                break
+
+            norm_res = np.linalg.norm(self.model.res)
+            if not np.isfinite(norm_res):
+                break
+            if self.needs_new_jacobian(norm_res, previous_norm_res):
+                self.refresh_jacobian()
+            previous_norm_res = norm_res
+
+            with self.profiler.timer('linear_solve'):
+                corr = self.linear_solver.solve(self.model.res)
+            self.iterations_with_jacobian += 1
+            self.model.inc -= corr
+            self.model.kinematic_update()
+            self.number_of_iterations += 1
+
+    def solve_arc_length_step(self):
+        n_motion = self.model.get_number_of_motion_dofs()
+        psi2 = self.sp.arc_length_psi * self.sp.arc_length_psi
+        load_factor = self.model.load_factor
+
+        self.model.advance_time_step(0.)
+        if self.sp.verbosity >= TypeOfVerbosity.STEPS:
+            print('load factor: ', load_factor, '; arc length increment: ', self.arc_length_increment,
+                  '; step: ', self.number_of_steps)
+
+        self.model.inc[:] = 0.
+        self.model.kinematic_update()
+        with self.profiler.timer('assembly'):
+            self.model.assemble_res(self.sp)
+        self.refresh_jacobian()
+        with self.profiler.timer('linear_solve'):
+            tangent = - self.linear_solver.solve(self.assemble_load_vector())
+
+        load_increment = self.arc_length_increment / np.sqrt(np.dot(tangent[:n_motion], tangent[:n_motion]) + psi2)
+        if self.previous_increment is not None and \
+                np.dot(tangent[:n_motion], self.previous_increment[:n_motion]) + psi2 * self.load_increment < 0.:
+            load_increment = - load_increment
+        predictor_inc, predictor_load_increment = load_increment * tangent[:n_motion], load_increment
+
+        self.model.inc[:] = load_increment * tangent
+        self.model.load_factor = load_factor + load_increment
+        self.model.kinematic_update()
+
+        self.number_of_iterations = 0
+        self.converged = False
+        previous_norm_res = None
+        while self.number_of_iterations < self.sp.nit_max:
+            with self.profiler.timer('assembly'):
+                ref = self.model.assemble_res(self.sp)
+            if self.is_converged(ref):
+                self.converged = True
+                break
+
+            norm_res = np.linalg.norm(self.model.res)
+            if not np.isfinite(norm_res):
+                break
+            if self.needs_new_jacobian(norm_res, previous_norm_res):
+                self.refresh_jacobian()
+                with self.profiler.timer('linear_solve'):
+                    tangent = - self.linear_solver.solve(self.assemble_load_vector())
+            previous_norm_res = norm_res
+
+            with self.profiler.timer('linear_solve'):
+                corr_res = - self.linear_solver.solve(self.model.res)
+            self.iterations_with_jacobian += 1
+            delta_load_factor = - np.dot(predictor_inc, corr_res[:n_motion]) / \
+                (np.dot(predictor_inc, tangent[:n_motion]) + psi2 * predictor_load_increment)
+            self.model.inc += corr_res + delta_load_factor * tangent
+            self.model.load_factor += delta_load_factor
+            self.model.kinematic_update()
+            self.number_of_iterations += 1
+
+        if self.converged:
+            self.previous_increment = np.copy(self.model.inc)
+            self.load_increment = self.model.load_factor - load_factor
+
+    def get_next_arc_length_increment(self):
+        if not self.converged:
+            factor = 0.5
+        else:
+            factor = min(max(np.sqrt(self.sp.nit_target / max(self.number_of_iterations, 1.)), 0.5), 2.)
+        arc_length_increment_max = np.inf if self.sp.arc_length_increment_max is None \
+            else self.sp.arc_length_increment_max
+        return min(factor * self.arc_length_increment, arc_length_increment_max)
+
+    def is_finished(self, number_of_steps):
+        if self.sp.arc_length:
+            return self.model.load_factor >= self.sp.load_factor_max * (1. - 1.e-12) or \
+                self.number_of_steps >= self.sp.max_number_of_steps
+        return self.number_of_steps >= number_of_steps
+
+    def solve(self):
+        self.model.profiler = self.profiler
+        self.model.initialize(TypeOfAnalysis.STATIC)
+        self.model.load_factor = 0. if self.sp.proportional_loading or self.sp.arc_length else 1.
+        if self.sp.arc_length:
+            self.model.time = self.sp.T
+
+        if self.logger:
+            self.logger.initialize(self.model, self)
+
+        self.linear_solver = build_linear_solver(self.sp, self.model.dof_permutation)
+        self.iterations_with_jacobian = 0
+        self.number_of_steps = 0
+        self.number_of_rejected_steps = 0
+        self.mean_number_of_iterations = 0.
+        self.max_number_of_iterations = 0.
+        self.previous_increment, self.load_increment = None, None
+        number_of_steps = int(self.sp.T / self.sp.h)
+        if self.sp.arc_length_increment is None:
+            self.arc_length_increment = self.sp.h / self.sp.T
+        else:
+            self.arc_length_increment = self.sp.arc_length_increment
+
+        if self.logger:
+            self.number_of_iterations = 0
+            self.model.assemble_res(self.sp)
+            self.logger.log_step(0)
+        self.profiler.end_step()
+
+        while not self.is_finished(number_of_steps):
+            load_factor = self.model.load_factor
+            with self.profiler.timer('step'):
+                if self.sp.arc_length:
+                    self.solve_arc_length_step()
+                    if self.converged and self.model.load_factor > self.sp.load_factor_max:
+                        self.model.reject_time_step()
+                        self.solve_load_step(self.sp.load_factor_max, self.model.time)
+                else:
+                    time = (self.number_of_steps + 1) * self.sp.h
+                    self.solve_load_step(time / self.sp.T if self.sp.proportional_loading else 1., time)
+
+            if not self.converged:
+                if not self.sp.arc_length or self.arc_length_increment <= self.sp.arc_length_increment_min:
+                    raise RuntimeError('Static solver did not converge at load factor ' + str(self.model.load_factor) +
+                                       ' and time ' + str(self.model.time))
+                self.model.reject_time_step()
+                self.model.load_factor = load_factor
+                self.number_of_rejected_steps += 1
+                self.arc_length_increment = max(self.get_next_arc_length_increment(),
+                                                self.sp.arc_length_increment_min)
+                self.profiler.end_step()
+                continue
+
+            self.number_of_steps += 1
+            self.max_number_of_iterations = max(self.max_number_of_iterations, self.number_of_iterations)
+            self.mean_number_of_iterations += self.number_of_iterations
+            if self.logger:
+                with self.profiler.timer('logging'):
+                    self.logger.log_step(self.number_of_steps)
+            self.profiler.set_counter('number_of_iterations', self.number_of_iterations)
+            self.profiler.set_counter('load_factor', self.model.load_factor)
+            self.profiler.end_step()
+            if self.sp.arc_length:
+                self.arc_length_increment = self.get_next_arc_length_increment()
+
+        if self.logger:
+            self.logger.finalize()
+        self.mean_number_of_iterations /= max(self.number_of_steps, 1)
+        if self.sp.verbosity >= TypeOfVerbosity.SUMMARY:
+            print('mean nit: ', self.mean_number_of_iterations, '; max nit: ', self.max_number_of_iterations,
+                  '; number of factorizations: ', self.linear_solver.number_of_factorizations)
+            if self.sp.arc_length:
+                print('accepted steps: ', self.number_of_steps, '; rejected steps: ', self.number_of_rejected_steps,
+                      '; load factor: ', self.model.load_factor)
+            print('linear solver: ', self.linear_solver.get_statistics())
+            if self.profiler.enabled:
+                self.profiler.print_summary()
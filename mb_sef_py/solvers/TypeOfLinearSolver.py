@@ -0,0 +1,2 @@
+class TypeOfLinearSolver:
+    SPARSE_LU, DENSE_LU, GMRES, MINRES = range(4)
@@ -0,0 +1,2 @@
+class TypeOfVerbosity:
+    SILENT, SUMMARY, STEPS, ITERATIONS = range(4)
@@ -1,2 +1,9 @@
 from .GeneralizedAlpha import GeneralizedAlpha
-from .SolverParameters import SolverParameters, TimeIntegrationParameters
+from .StaticSolver import StaticSolver
+from .ModalAnalysis import ModalAnalysis, craig_bampton_reduction
+from .Ensemble import Ensemble
+from .SolverParameters import SolverParameters, TimeIntegrationParameters, StaticParameters
+from .TypeOfLinearSolver import TypeOfLinearSolver
+from .LinearSolver import LinearSolver, SparseLUSolver, DenseLUSolver, KrylovSolver, build_linear_solver
+from .TypeOfVerbosity import TypeOfVerbosity
+from .SolverObserver import SolverObserver, ConvergenceHistory, IterationReport, StepReport
@@ -0,0 +1,16 @@
+import os
+import numpy as np
+
+
+def write_checkpoint(file_name, state):
+    temporary_file_name = file_name + '.tmp'
+    with open(temporary_file_name, 'wb') as file:
+        np.savez(file, **state)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_file_name, file_name)
+
+
+def read_checkpoint(file_name):
+    with np.load(file_name) as data:
+        return {name: data[name] for name in data.files}
@@ -1,11 +1,15 @@
 import h5py
+import numpy as np
 
 
 class Logger:
-    def __init__(self, file_name, periodicity=1):
+    def __init__(self, file_name, periodicity=1, buffer_size=1000, compression=None):
         self.file_name = file_name
         self.periodicity = periodicity
+        self.buffer_size = buffer_size
+        self.compression = compression
         self.number_of_steps_logged = 0
+        self.number_of_steps_flushed = 0
 
         self.model = None
         self.solver = None
@@ -14,43 +18,147 @@ class Logger:
         self.time_dataset_id = None
         self.mechanical_power_dataset_id = None
         self.nit_dataset_id = None
+        self.buffer = None
+        self.sensor_buffer = None
+        self.sensor_getters = None
+        self.sensor_gather_index = None
 
         self.list_sensors = []
 
     def add_sensor(self, sensor):
         self.list_sensors.append(sensor)
 
+    def get_expected_number_of_logged_steps(self):
+        number_of_steps = self.solver.get_expected_number_of_steps()
+        if number_of_steps is None:
+            return None
+        return number_of_steps // self.periodicity + 1
+
+    def create_dataset(self, name, number_of_rows, number_of_steps, chunk_size):
+        if number_of_rows is None:
+            return self.file_id.create_dataset(name, (number_of_steps,), maxshape=(None,),
+                                               chunks=(chunk_size,), compression=self.compression)
+        return self.file_id.create_dataset(name, (number_of_rows, number_of_steps),
+                                           maxshape=(number_of_rows, None),
+                                           chunks=(max(number_of_rows, 1), chunk_size), compression=self.compression)
+
     def initialize(self, model, solver):
         self.model = model
         self.solver = solver
 
         self.file_id = h5py.File(self.file_name + '.h5', mode='w')
         self.number_of_steps_logged = 0
+        self.number_of_steps_flushed = 0
+
+        number_of_steps = self.get_expected_number_of_logged_steps()
+        if number_of_steps is None:
+            number_of_steps = self.buffer_size
+        chunk_size = max(min(self.buffer_size, number_of_steps), 1)
 
-        self.time_dataset_id = self.file_id.create_dataset('time', (1, ), maxshape=(None, ))
-        self.mechanical_power_dataset_id = self.file_id.create_dataset('mechanical_power', (1,), maxshape=(None,))
-        self.nit_dataset_id = self.file_id.create_dataset('number_of_iterations', (1,), maxshape=(None,))
+        self.time_dataset_id = self.create_dataset('time', None, number_of_steps, chunk_size)
+        self.mechanical_power_dataset_id = self.create_dataset('mechanical_power', None, number_of_steps, chunk_size)
+        self.nit_dataset_id = self.create_dataset('number_of_iterations', None, number_of_steps, chunk_size)
+        self.buffer = np.zeros((3, self.buffer_size))
 
         for sensor in self.list_sensors:
+            sensor.initialize(model)
             group_name = sensor.get_group_name()
             name, size = sensor.get_dataset_name(), sensor.get_dataset_number_of_rows()
-            sensor.dataset_id = self.file_id.create_dataset(group_name + '/' + name, (size, 0), maxshape=(size, None))
+            sensor.dataset_id = self.create_dataset(group_name + '/' + name, size, number_of_steps, chunk_size)
+        self.initialize_sensor_buffers()
+
+    def initialize_sensor_buffers(self):
+        self.sensor_buffer = np.zeros((sum(sensor.get_dataset_number_of_rows() for sensor in self.list_sensors),
+                                       self.buffer_size))
+        self.sensor_getters, self.sensor_gather_index = None, None
+        row = 0
+        for sensor in self.list_sensors:
+            number_of_rows = sensor.get_dataset_number_of_rows()
+            sensor.buffer = self.sensor_buffer[row:row + number_of_rows]
+            row += number_of_rows
+
+    def initialize_sensor_gathering(self):
+        sources, self.sensor_getters, gather_index = {}, [], []
+        size = 0
+        for sensor in self.list_sensors:
+            for key, getter, indices in sensor.get_sources(self.model):
+                if key not in sources:
+                    sources[key] = size
+                    self.sensor_getters.append(getter)
+                    size += len(getter())
+                gather_index.append(sources[key] + indices)
+        self.sensor_gather_index = np.concatenate(gather_index) if gather_index else np.zeros((0,), dtype=int)
+
+    def gather_sensor_values(self):
+        if self.sensor_getters is None:
+            self.initialize_sensor_gathering()
+        if not self.sensor_getters:
+            return np.zeros((0,))
+        return np.concatenate([getter() for getter in self.sensor_getters])[self.sensor_gather_index]
+
+    def get_state(self):
+        self.flush()
+        self.file_id.flush()
+        return {'number_of_steps_logged': self.number_of_steps_logged}
+
+    def restart(self, model, solver, state):
+        self.model = model
+        self.solver = solver
+
+        self.file_id = h5py.File(self.file_name + '.h5', mode='r+')
+        self.number_of_steps_logged = int(state['number_of_steps_logged'])
+        self.number_of_steps_flushed = self.number_of_steps_logged
+        if 'profiling' in self.file_id:
+            del self.file_id['profiling']
+
+        self.time_dataset_id = self.file_id['time']
+        self.mechanical_power_dataset_id = self.file_id['mechanical_power']
+        self.nit_dataset_id = self.file_id['number_of_iterations']
+        self.buffer = np.zeros((3, self.buffer_size))
+
+        for sensor in self.list_sensors:
+            sensor.initialize(model)
+            sensor.dataset_id = self.file_id[sensor.get_group_name() + '/' + sensor.get_dataset_name()]
+        self.initialize_sensor_buffers()
 
     def log_step(self, step_number):
         if step_number % self.periodicity == 0:
-            self.time_dataset_id.resize((self.number_of_steps_logged+1, ))
-            self.time_dataset_id[self.number_of_steps_logged] = self.model.time
+            index = self.number_of_steps_logged - self.number_of_steps_flushed
+            self.buffer[0, index] = self.model.time
+            self.buffer[1, index] = self.model.get_mechanical_power()
+            self.buffer[2, index] = self.solver.number_of_iterations
 
-            self.mechanical_power_dataset_id.resize((self.number_of_steps_logged+1, ))
-            self.mechanical_power_dataset_id[self.number_of_steps_logged] = self.model.mechanical_power
-
-            self.nit_dataset_id.resize((self.number_of_steps_logged + 1,))
-            self.nit_dataset_id[self.number_of_steps_logged] = self.solver.number_of_iterations
+            self.sensor_buffer[:, index] = self.gather_sensor_values()
 
+            self.number_of_steps_logged += 1
+            if self.number_of_steps_logged - self.number_of_steps_flushed == self.buffer_size:
+                self.flush()
+
+    def flush(self):
+        start, end = self.number_of_steps_flushed, self.number_of_steps_logged
+        if end == start:
+            return
+        if self.time_dataset_id.shape[0] < end:
+            number_of_steps = max(end, self.time_dataset_id.shape[0] + self.buffer_size)
+            for dataset_id in [self.time_dataset_id, self.mechanical_power_dataset_id, self.nit_dataset_id]:
+                dataset_id.resize((number_of_steps,))
             for sensor in self.list_sensors:
-                sensor.log_step(self.model, self.number_of_steps_logged)
+                sensor.dataset_id.resize(number_of_steps, axis=1)
 
-            self.number_of_steps_logged += 1
+        self.time_dataset_id[start:end] = self.buffer[0, :end - start]
+        self.mechanical_power_dataset_id[start:end] = self.buffer[1, :end - start]
+        self.nit_dataset_id[start:end] = self.buffer[2, :end - start]
+        for sensor in self.list_sensors:
+            sensor.dataset_id[:, start:end] = sensor.buffer[:, :end - start]
+
+        self.number_of_steps_flushed = end
 
     def finalize(self):
+        self.flush()
+        if self.solver.profiler.enabled:
+            self.solver.profiler.write(self.file_id.create_group('profiling'))
+        for dataset_id in [self.time_dataset_id, self.mechanical_power_dataset_id, self.nit_dataset_id]:
+            dataset_id.resize((self.number_of_steps_logged,))
+        for sensor in self.list_sensors:
+            sensor.dataset_id.resize(self.number_of_steps_logged, axis=1)
         self.file_id.close()
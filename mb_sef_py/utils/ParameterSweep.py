@@ -0,0 +1,99 @@
+import contextlib
+import itertools
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import h5py
+import numpy as np
+
+
+def expand_parameter_grid(parameter_grid):
+    if isinstance(parameter_grid, dict):
+        names = list(parameter_grid.keys())
+        return [dict(zip(names, values)) for values in itertools.product(*[parameter_grid[n] for n in names])]
+    return [dict(parameters) for parameters in parameter_grid]
+
+
+def run_case(solver_factory, case_name, parameters, quiet=True):
+    summary = {
+        'case_name': case_name,
+        'parameters': parameters,
+        'error': None,
+    }
+    t0 = time.perf_counter()
+    try:
+        with open(os.devnull, 'w') as devnull, \
+                contextlib.redirect_stdout(devnull) if quiet else contextlib.nullcontext():
+            solver = solver_factory(case_name, **parameters)
+            solver.solve()
+        summary.update({
+            'number_of_steps': solver.number_of_steps,
+            'mean_number_of_iterations': solver.mean_number_of_iterations,
+            'max_number_of_iterations': solver.max_number_of_iterations,
+            'number_of_factorizations': solver.linear_solver.number_of_factorizations,
+            'output_file': solver.logger.file_name + '.h5' if solver.logger else None,
+        })
+    except Exception:
+        summary['error'] = traceback.format_exc()
+    summary['wall_time'] = time.perf_counter() - t0
+    return summary
+
+
+class ParameterSweep:
+    def __init__(self, solver_factory, parameter_grid, name='sweep', max_workers=None, quiet=True):
+        self.solver_factory = solver_factory
+        self.list_parameters = expand_parameter_grid(parameter_grid)
+        self.name = name
+        self.max_workers = max_workers
+        self.quiet = quiet
+
+        self.list_summaries = None
+
+    def get_number_of_cases(self):
+        return len(self.list_parameters)
+
+    def get_case_name(self, case_number):
+        return self.name + '_' + str(case_number).zfill(len(str(self.get_number_of_cases() - 1)))
+
+    def run(self):
+        n_cases = self.get_number_of_cases()
+        case_names = [self.get_case_name(i) for i in range(n_cases)]
+        if self.max_workers == 1:
+            self.list_summaries = [run_case(self.solver_factory, case_names[i], self.list_parameters[i], self.quiet)
+                                   for i in range(n_cases)]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                self.list_summaries = list(executor.map(run_case, itertools.repeat(self.solver_factory, n_cases),
+                                                        case_names, self.list_parameters,
+                                                        itertools.repeat(self.quiet, n_cases)))
+        self.print_summaries()
+        return self.list_summaries
+
+    def print_summaries(self):
+        for summary in self.list_summaries:
+            if summary['error'] is None:
+                print(summary['case_name'], '; mean nit: ', summary['mean_number_of_iterations'],
+                      '; max nit: ', summary['max_number_of_iterations'], '; wall time: ', summary['wall_time'])
+            else:
+                print(summary['case_name'], '; failed: ', summary['error'].strip().splitlines()[-1])
+
+    def consolidate(self, file_name=None):
+        file_name = self.name if file_name is None else file_name
+        with h5py.File(file_name + '.h5', mode='w') as file_id:
+            for summary in self.list_summaries:
+                group_id = file_id.create_group(summary['case_name'])
+                for key, value in summary['parameters'].items():
+                    if np.isscalar(value) and not callable(value):
+                        group_id.attrs[key] = value
+                for key in ['wall_time', 'number_of_steps', 'mean_number_of_iterations',
+                            'max_number_of_iterations', 'number_of_factorizations']:
+                    if key in summary:
+                        group_id.attrs[key] = summary[key]
+                if summary['error'] is not None:
+                    group_id.attrs['error'] = summary['error']
+                elif summary['output_file'] is not None:
+                    output_file = os.path.relpath(summary['output_file'],
+                                                  os.path.dirname(os.path.abspath(file_name + '.h5')))
+                    group_id['results'] = h5py.ExternalLink(output_file, '/')
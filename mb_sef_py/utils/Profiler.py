@@ -0,0 +1,86 @@
+import contextlib
+import time
+
+import numpy as np
+
+
+class Timer:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.t0 = None
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.add_time(self.name, time.perf_counter() - self.t0)
+        return False
+
+
+class Profiler:
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.null_timer = contextlib.nullcontext()
+
+        self.cumulative_times = {}
+        self.number_of_calls = {}
+        self.step_times = {}
+        self.step_counters = {}
+        self.list_step_times = []
+        self.list_step_counters = []
+
+    def reset(self):
+        self.cumulative_times.clear()
+        self.number_of_calls.clear()
+        self.step_times.clear()
+        self.step_counters.clear()
+        self.list_step_times.clear()
+        self.list_step_counters.clear()
+
+    def timer(self, name):
+        if not self.enabled:
+            return self.null_timer
+        return Timer(self, name)
+
+    def add_time(self, name, elapsed_time):
+        self.cumulative_times[name] = self.cumulative_times.get(name, 0.) + elapsed_time
+        self.number_of_calls[name] = self.number_of_calls.get(name, 0) + 1
+        self.step_times[name] = self.step_times.get(name, 0.) + elapsed_time
+
+    def set_counter(self, name, value):
+        if self.enabled:
+            self.step_counters[name] = value
+
+    def end_step(self):
+        if self.enabled:
+            self.list_step_times.append(self.step_times)
+            self.list_step_counters.append(self.step_counters)
+            self.step_times, self.step_counters = {}, {}
+
+    def get_step_history(self, list_of_dicts):
+        names = sorted(set(name for d in list_of_dicts for name in d))
+        return {name: np.array([d.get(name, np.nan) for d in list_of_dicts]) for name in names}
+
+    def get_summary(self):
+        counters = self.get_step_history(self.list_step_counters)
+        return {
+            'number_of_steps': len(self.list_step_times),
+            'cumulative_times': dict(self.cumulative_times),
+            'number_of_calls': dict(self.number_of_calls),
+            'mean_counters': {name: np.nanmean(values) for name, values in counters.items()},
+            'max_counters': {name: np.nanmax(values) for name, values in counters.items()},
+        }
+
+    def print_summary(self):
+        total_time = self.cumulative_times.get('step', sum(self.cumulative_times.values()))
+        for name, elapsed_time in sorted(self.cumulative_times.items(), key=lambda item: -item[1]):
+            print(name, ': ', elapsed_time, ' s (', 100. * elapsed_time / max(total_time, 1.e-30), ' %) in ',
+                  self.number_of_calls[name], ' calls')
+
+    def write(self, group_id):
+        for name, values in self.get_step_history(self.list_step_times).items():
+            group_id.create_dataset('times/' + name, data=np.nan_to_num(values))
+        for name, values in self.get_step_history(self.list_step_counters).items():
+            group_id.create_dataset('counters/' + name, data=values)
@@ -0,0 +1,119 @@
+import h5py
+import numpy as np
+
+from ..math.SO3 import QuaternionArray
+
+
+class Results:
+    def __init__(self, file_name, block_size=2**26):
+        self.file_name = file_name if file_name.endswith('.h5') else file_name + '.h5'
+        self.block_size = block_size
+
+        self.file_id = None
+        self.time = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def open(self):
+        if self.file_id is None:
+            self.file_id = h5py.File(self.file_name, mode='r')
+        return self.file_id
+
+    def close(self):
+        if self.file_id is not None:
+            self.file_id.close()
+        self.file_id = None
+        self.time = None
+
+    def get_names(self):
+        names = []
+        self.open().visititems(lambda name, item: names.append(name) if isinstance(item, h5py.Dataset) else None)
+        return names
+
+    def get_dataset(self, name):
+        return self.open()[name]
+
+    def get_number_of_steps(self):
+        return self.get_dataset('time').shape[0]
+
+    def get_time(self):
+        if self.time is None:
+            self.time = self.get_dataset('time')[:]
+        return self.time
+
+    def get_window(self, t_start=None, t_end=None):
+        if t_start is None and t_end is None:
+            return 0, self.get_number_of_steps()
+        time = self.get_time()
+        i0 = 0 if t_start is None else int(np.searchsorted(time, t_start, side='left'))
+        i1 = len(time) if t_end is None else int(np.searchsorted(time, t_end, side='right'))
+        return i0, i1
+
+    def get_block_columns(self, dataset, number_of_rows):
+        chunk_columns = dataset.chunks[-1] if dataset.chunks is not None else 1
+        block_columns = max(self.block_size // max(number_of_rows * dataset.dtype.itemsize, 1), 1)
+        return max(block_columns // chunk_columns, 1) * chunk_columns
+
+    def iterate_blocks(self, name, i0, i1, rows=slice(None)):
+        dataset = self.get_dataset(name)
+        number_of_rows = 1 if dataset.ndim == 1 else len(range(dataset.shape[0])[rows])
+        block_columns = self.get_block_columns(dataset, number_of_rows)
+        b0 = i0
+        while b0 < i1:
+            b1 = min(i1, (b0 // block_columns + 1) * block_columns)
+            if dataset.ndim == 1:
+                yield b0, b1, np.asarray(dataset[b0:b1])[np.newaxis, :]
+            else:
+                yield b0, b1, np.asarray(dataset[rows, b0:b1])
+            b0 = b1
+
+    def read(self, name, t_start=None, t_end=None, stride=1, rows=slice(None)):
+        i0, i1 = self.get_window(t_start, t_end)
+        blocks = []
+        for b0, b1, block in self.iterate_blocks(name, i0, i1, rows):
+            blocks.append(block[:, (i0 - b0) % stride::stride])
+        values = np.concatenate(blocks, axis=1) if blocks else np.zeros((0, 0))
+        if self.get_dataset(name).ndim == 1:
+            values = values[0] if blocks else np.zeros((0,))
+        return self.get_time()[i0:i1:stride], values
+
+    def read_min_max(self, name, number_of_points, t_start=None, t_end=None, rows=slice(None)):
+        i0, i1 = self.get_window(t_start, t_end)
+        if i1 - i0 <= 2 * number_of_points:
+            time, values = self.read(name, t_start, t_end, rows=rows)
+            return time, values, values
+
+        bin_edges = np.linspace(i0, i1, number_of_points + 1).astype(int)
+        minimum, maximum = None, None
+        for b0, b1, block in self.iterate_blocks(name, i0, i1, rows):
+            if minimum is None:
+                minimum = np.full((block.shape[0], number_of_points), np.inf)
+                maximum = np.full((block.shape[0], number_of_points), -np.inf)
+            bins = np.arange(np.searchsorted(bin_edges, b0, side='right') - 1,
+                             np.searchsorted(bin_edges, b1 - 1, side='right'))
+            starts = np.maximum(bin_edges[bins], b0) - b0
+            minimum[:, bins] = np.minimum(minimum[:, bins], np.minimum.reduceat(block, starts, axis=1))
+            maximum[:, bins] = np.maximum(maximum[:, bins], np.maximum.reduceat(block, starts, axis=1))
+
+        time = self.get_time()[bin_edges[:-1]]
+        if self.get_dataset(name).ndim == 1:
+            return time, minimum[0], maximum[0]
+        return time, minimum, maximum
+
+    def read_nodal_rows(self, name, first_row, last_row, t_start, t_end, stride, number_of_rows_per_node):
+        time, values = self.read(name, t_start, t_end, stride)
+        values = values.reshape((-1, number_of_rows_per_node, values.shape[-1]))[:, first_row:last_row, :]
+        values = np.moveaxis(values, -1, 0)
+        return time, values[:, 0, :] if values.shape[1] == 1 else values
+
+    def get_positions(self, name, t_start=None, t_end=None, stride=1, number_of_rows_per_node=7):
+        return self.read_nodal_rows(name, 0, 3, t_start, t_end, stride, number_of_rows_per_node)
+
+    def get_rotation_matrices(self, name, t_start=None, t_end=None, stride=1, number_of_rows_per_node=7):
+        time, q = self.read_nodal_rows(name, number_of_rows_per_node - 4, number_of_rows_per_node,
+                                       t_start, t_end, stride, number_of_rows_per_node)
+        return time, QuaternionArray(q=q.astype(float)).get_rotation_matrix()
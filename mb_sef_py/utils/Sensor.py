@@ -1,4 +1,7 @@
 import abc
+import numpy as np
+
+from ..core.TypeOfVariables import TypeOfVariables
 
 
 class LogNodalFields:
@@ -6,12 +9,54 @@ class LogNodalFields:
 
 
 class LogElementFields:
-    LM = range(1)
+    LM, RELATIVE_MOTION, INTERNAL_FORCES = range(3)
+
+
+def get_nodal_field_name(log_field):
+    if log_field == LogNodalFields.MOTION:
+        return 'MOTION'
+    elif log_field == LogNodalFields.VELOCITY:
+        return 'VELOCITY'
+    elif log_field == LogNodalFields.ACCELERATION:
+        return 'ACCELERATION'
+    else:
+        return ''
+
+
+def get_nodal_number_of_rows(node, log_field):
+    if log_field == LogNodalFields.MOTION:
+        return node.get_number_of_motion_coordinates()
+    elif log_field in [LogNodalFields.VELOCITY, LogNodalFields.ACCELERATION]:
+        return node.get_number_of_dofs()
+    else:
+        return 0
+
+
+def get_nodal_sources(model, node, log_field):
+    if log_field == LogNodalFields.MOTION:
+        group = node.group
+        if group is None:
+            return [(('coordinates', id(node)), lambda: node.get_motion_coordinates(model.current_configuration),
+                     np.arange(node.get_number_of_motion_coordinates()))]
+        return [(('coordinates', id(group)), lambda: group.get_motion_coordinates(model.current_configuration),
+                 group.get_motion_coordinates_indices(node))]
+
+    first_index_dof = model.dof_offsets[node.get_field()] + node.get_first_index_dof()
+    indices = np.arange(first_index_dof, first_index_dof + node.get_number_of_dofs())
+    if log_field == LogNodalFields.VELOCITY:
+        return [(('v',), lambda: model.v, indices)]
+    elif log_field == LogNodalFields.ACCELERATION:
+        return [(('v_dot',), lambda: model.v_dot, indices)]
+    return []
 
 
 class Sensor(abc.ABC):
     def __init__(self):
         self.dataset_id = None
+        self.buffer = None
+
+    def initialize(self, model):
+        pass
 
     @abc.abstractmethod
     def get_group_name(self):
@@ -26,9 +71,12 @@ class Sensor(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def log_step(self, model, step):
+    def get_sources(self, model):
         pass
 
+    def get_values(self, model):
+        return np.concatenate([getter()[indices] for _, getter, indices in self.get_sources(model)])
+
 
 class SensorNode(Sensor):
     def __init__(self, node, log_field):
@@ -43,30 +91,79 @@ class SensorNode(Sensor):
             return 'node_' + str(self.node.node_number)
 
     def get_dataset_name(self):
-        if self.log_field == LogNodalFields.MOTION:
-            return 'MOTION'
-        elif self.log_field == LogNodalFields.VELOCITY:
-            return 'VELOCITY'
-        elif self.log_field == LogNodalFields.ACCELERATION:
-            return 'ACCELERATION'
+        return get_nodal_field_name(self.log_field)
+
+    def get_dataset_number_of_rows(self):
+        return get_nodal_number_of_rows(self.node, self.log_field)
+
+    def get_sources(self, model):
+        return get_nodal_sources(model, self.node, self.log_field)
+
+
+class SensorField(Sensor):
+    def __init__(self, list_nodes, log_field, name):
+        Sensor.__init__(self)
+        self.list_nodes = list_nodes
+        self.log_field = log_field
+        self.name = name
+
+    def get_group_name(self):
+        return self.name
+
+    def get_dataset_name(self):
+        return get_nodal_field_name(self.log_field)
+
+    def get_dataset_number_of_rows(self):
+        return sum(get_nodal_number_of_rows(node, self.log_field) for node in self.list_nodes)
+
+    def get_sources(self, model):
+        return [source for node in self.list_nodes for source in get_nodal_sources(model, node, self.log_field)]
+
+
+class SensorElement(Sensor):
+    def __init__(self, element, log_field, name=None):
+        Sensor.__init__(self)
+        self.element = element
+        self.log_field = log_field
+        self.name = name
+
+    def initialize(self, model):
+        if self.name is None:
+            self.name = 'element_' + str(model.list_elements.index(self.element))
+
+    def get_group_name(self):
+        return self.name
+
+    def get_dataset_name(self):
+        if self.log_field == LogElementFields.LM:
+            return 'LM'
+        elif self.log_field == LogElementFields.RELATIVE_MOTION:
+            return 'RELATIVE_MOTION'
+        elif self.log_field == LogElementFields.INTERNAL_FORCES:
+            return 'INTERNAL_FORCES'
         else:
             return ''
 
+    def get_list_nodes(self):
+        if self.log_field == LogElementFields.LM:
+            return self.element.list_nodes[TypeOfVariables.LAGRANGE_MULTIPLIER]
+        elif self.log_field == LogElementFields.RELATIVE_MOTION:
+            return self.element.list_nodes[TypeOfVariables.RELATIVE_MOTION]
+        return []
+
     def get_dataset_number_of_rows(self):
-        if self.log_field == LogNodalFields.MOTION:
-            return self.node.get_number_of_motion_coordinates()
-        elif self.log_field in [LogNodalFields.VELOCITY, LogNodalFields.ACCELERATION]:
-            return self.node.get_number_of_dofs()
-        else:
-            return 0
-
-    def log_step(self, model, step):
-        self.dataset_id.resize(step+1, axis=1)
-        if self.log_field == LogNodalFields.MOTION:
-            self.dataset_id[:, step] = self.node.get_motion_coordinates(model.current_configuration)
-        elif self.log_field == LogNodalFields.VELOCITY:
-            first_index_dof = model.dof_offsets[self.node.get_field()] + self.node.get_first_index_dof()
-            self.dataset_id[:, step] = model.v[first_index_dof:first_index_dof+self.node.get_number_of_dofs()]
-        elif self.log_field == LogNodalFields.ACCELERATION:
-            first_index_dof = model.dof_offsets[self.node.get_field()] + self.node.get_first_index_dof()
-            self.dataset_id[:, step] = model.v_dot[first_index_dof:first_index_dof+self.node.get_number_of_dofs()]
+        if self.log_field == LogElementFields.INTERNAL_FORCES:
+            return self.element.get_number_of_internal_forces()
+        return sum(node.get_number_of_motion_coordinates() for node in self.get_list_nodes())
+
+    def get_sources(self, model):
+        if self.log_field == LogElementFields.INTERNAL_FORCES:
+            element, group = self.element, self.element.group
+            n_forces = element.get_number_of_internal_forces()
+            if group is None:
+                return [(('internal_forces', id(element)), lambda: element.get_internal_forces(model),
+                         np.arange(n_forces))]
+            return [(('internal_forces', id(group)), lambda: group.get_internal_forces(model),
+                     np.arange(n_forces * element.index_in_group, n_forces * (element.index_in_group + 1)))]
+        return [source for node in self.get_list_nodes()
+                for source in get_nodal_sources(model, node, LogNodalFields.MOTION)]
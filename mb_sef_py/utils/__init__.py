@@ -1,2 +1,6 @@
 from .Logger import Logger
-from .Sensor import LogNodalFields, SensorNode
+from .Results import Results
+from .Sensor import LogNodalFields, LogElementFields, Sensor, SensorNode, SensorField, SensorElement
+from .ParameterSweep import ParameterSweep, expand_parameter_grid
+from .Profiler import Profiler
+from .Checkpoint import write_checkpoint, read_checkpoint
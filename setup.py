@@ -11,6 +11,6 @@ setup(name='mb_sef_py',
       version= major + '.' + minor + '.' + patch,
       license="",
       description='mb_sef_py',
-      packages=find_packages(),
+      packages=find_packages(exclude=['benchmarks']),
       install_requires=[]
       )